@@ -1,17 +1,37 @@
+import atexit
 import os
+import socket
+import subprocess
 import webbrowser
-import threading
 import time
 import sys
 
 BASE_DIR = os.path.dirname(sys.executable)
+HOST = '127.0.0.1'
+PORT = 8000
 
-def start_server():
-    os.chdir(BASE_DIR)
-    os.system(f'"{sys.executable}" manage.py runserver 127.0.0.1:8000')
 
-threading.Thread(target=start_server).start()
+def wait_for_server(timeout=15):
+    """Poll the dev server port until it accepts connections or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((HOST, PORT), timeout=0.2).close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
 
-time.sleep(6)
 
-webbrowser.open("http://127.0.0.1:8000")
+proc = subprocess.Popen(
+    [sys.executable, 'manage.py', 'runserver', f'{HOST}:{PORT}'],
+    cwd=BASE_DIR,
+    stdout=subprocess.DEVNULL,
+)
+atexit.register(proc.terminate)
+
+wait_for_server()
+
+webbrowser.open(f"http://{HOST}:{PORT}")
+
+proc.wait()
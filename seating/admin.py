@@ -1,12 +1,15 @@
 from django.contrib import admin
 from django.apps import apps
 
+from .apps import cache_subject_field_names
+
 # Get Subject model if present
 Subject = apps.get_model('seating', 'Subject')
 
 if Subject is not None:
-    # Determine which preferred fields actually exist on the model
-    model_field_names = {f.name for f in Subject._meta.get_fields()}
+    # Determine which preferred fields actually exist on the model. Admin is
+    # autodiscovered before SeatingConfig.ready(), so populate the cache here.
+    model_field_names = cache_subject_field_names(Subject)
 
     preferred_display = ('name', 'subject_code', 'semester_number', 'is_active')
     preferred_filters = ('semester_number', 'is_active')
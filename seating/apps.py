@@ -0,0 +1,29 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+def cache_subject_field_names(subject_model):
+    """
+    Store Subject's field-name set and semester field name on the model class
+    so admin and forms can look them up without re-walking _meta.
+    """
+    if '_field_names' not in subject_model.__dict__:
+        names = frozenset(f.name for f in subject_model._meta.get_fields())
+        subject_model._field_names = names
+        subject_model._sem_field_name = (
+            'semester_number' if 'semester_number' in names
+            else ('semester' if 'semester' in names else None)
+        )
+    return subject_model._field_names
+
+
+class SeatingConfig(AppConfig):
+    name = 'seating'
+
+    def ready(self):
+        from .utils.db import configure_sqlite_connection
+
+        cache_subject_field_names(self.get_model('Subject'))
+        connection_created.connect(
+            configure_sqlite_connection, dispatch_uid='seating.sqlite_pragmas'
+        )
@@ -1,6 +1,12 @@
 from django import forms
 from .models import Subject
 
+_YEAR_TO_SEM = {
+    'odd': {1: 1, 2: 3, 3: 5, 4: 7},
+    'even': {1: 2, 2: 4, 3: 6, 4: 8},
+}
+
+
 class AllocationValidationForm(forms.Form):
     semester_type = forms.ChoiceField(choices=(('odd','Odd'),('even','Even')))
     # dynamic fields subject_year_X will be in POST; we'll validate in clean()
@@ -13,34 +19,57 @@ class AllocationValidationForm(forms.Form):
         cleaned = super().clean()
         sem_type = cleaned.get('semester_type')
         if not sem_type:
-            raise forms.ValidationError("Semester type is required.")
-
-        year_to_sem = {
-            'odd': {1:1,2:3,3:5,4:7},
-            'even':{1:2,2:4,3:6,4:8}
-        }[sem_type]
+            # the field's own required/choice error is already recorded
+            return cleaned
 
-        # determine actual semester field name on Subject model
-        model_field_names = {f.name for f in Subject._meta.get_fields()}
-        semester_field = 'semester_number' if 'semester_number' in model_field_names else ('semester' if 'semester' in model_field_names else None)
+        year_to_sem = _YEAR_TO_SEM[sem_type]
 
-        selected = {}
-        for y in self.detected_years:
+        # subject_year_X are not declared fields, so errors are collected as
+        # non-field errors and every problem is reported in a single pass
+        wanted = {}
+        for raw_year in self.detected_years:
+            try:
+                y = int(raw_year)
+            except (TypeError, ValueError):
+                self.add_error(None, f"Invalid year: {raw_year}.")
+                continue
             field = f"subject_year_{y}"
             val = self.data.get(field)
             if not val:
-                raise forms.ValidationError(f"Subject for Year {y} is required.")
+                self.add_error(None, f"Subject for Year {y} is required.")
+                continue
             try:
-                subj = Subject.objects.get(pk=int(val))
-            except (Subject.DoesNotExist, ValueError):
-                raise forms.ValidationError(f"Invalid subject selected for Year {y}.")
+                wanted[y] = int(val)
+            except ValueError:
+                self.add_error(None, f"Invalid subject selected for Year {y}.")
+
+        # semester field name is cached on Subject by SeatingConfig.ready()
+        sem_field = Subject._sem_field_name
+
+        # map selected pk -> semester so validation below is pure dict lookups
+        if not wanted:
+            by_pk = {}
+        elif sem_field:
+            # one query for all selected subjects, fetching only the two columns needed
+            rows = Subject.objects.filter(pk__in=set(wanted.values())).values('pk', sem_field)
+            by_pk = {r['pk']: r[sem_field] for r in rows}
+        else:
+            by_pk = dict.fromkeys(
+                Subject.objects.filter(pk__in=set(wanted.values())).values_list('pk', flat=True)
+            )
+
+        selected = {}
+        for y, pk in wanted.items():
+            if pk not in by_pk:
+                self.add_error(None, f"Invalid subject selected for Year {y}.")
+                continue
 
-            subj_sem = getattr(subj, semester_field, None) if semester_field else None
-            expected_sem = year_to_sem.get(int(y))
-            if subj_sem != expected_sem:
-                raise forms.ValidationError(f"Selected subject for Year {y} must be for Semester {expected_sem}.")
-            selected[y] = subj.id
+            expected_sem = year_to_sem.get(y)
+            if by_pk[pk] != expected_sem:
+                self.add_error(None, f"Selected subject for Year {y} must be for Semester {expected_sem}.")
+                continue
+            selected[y] = pk
 
         # ensure one subject per year checked by loop above
         cleaned['selected_subjects'] = selected
-        return cleaned
\ No newline at end of file
+        return cleaned
@@ -1,10 +1,15 @@
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from seating.models import Student, BatchMapping
-from seating.utils.allocation import parse_excel_or_csv_file
+from seating.utils.db import importer_pragmas
+from seating.utils.parsers import iter_student_file_batches
 import os
 
 
+BATCH_SIZE = 1000
+UPDATE_FIELDS = ['name', 'batch_code', 'dept_code', 'serial', 'year', 'department', 'extra']
+
+
 class Command(BaseCommand):
     help = 'Import students from Excel file'
 
@@ -28,51 +33,77 @@ class Command(BaseCommand):
             raise CommandError(f'File "{excel_file_path}" does not exist')
 
         try:
-            with open(excel_file_path, 'rb') as f:
-                students_data, invalid_rows = parse_excel_or_csv_file(f)
+            seen_rolls = set()
+            created_count = 0
+            updated_count = 0
+            invalid_count = 0
+            invalid_preview = []
+
+            # BatchMapping is tiny and static for the run: resolve years from a dict
+            batch_map = dict(BatchMapping.objects.values_list('batch_code', 'year'))
+
+            # Rows are parsed and written every BATCH_SIZE rows, so peak
+            # memory is bounded by one batch while the import still commits once.
+            with open(excel_file_path, 'rb') as f, importer_pragmas(), transaction.atomic():
+                for batch, invalid in iter_student_file_batches(f, batch_map, batch_size=BATCH_SIZE):
+                    invalid_count += len(invalid)
+                    invalid_preview.extend(invalid[:5 - len(invalid_preview)])
+
+                    if dry_run:
+                        seen_rolls.update(row['roll'] for row in batch)
+                    elif batch:
+                        created, updated = self._write_batch(batch, seen_rolls)
+                        created_count += created
+                        updated_count += updated
+
+            # a roll repeated within or across batches is one student
+            total_count = len(seen_rolls)
 
-            if invalid_rows:
+            if invalid_count:
                 self.stdout.write(
-                    self.style.WARNING(f'Found {len(invalid_rows)} invalid rows:')
+                    self.style.WARNING(f'Found {invalid_count} invalid rows:')
                 )
-                for invalid in invalid_rows[:5]:  # Show first 5
+                for invalid in invalid_preview:  # Show first 5
                     self.stdout.write(f'  Row {invalid["row_number"]}: {invalid["error"]}')
 
             if dry_run:
                 self.stdout.write(
-                    self.style.SUCCESS(f'Dry run: Would import {len(students_data)} students')
+                    self.style.SUCCESS(f'Dry run: Would import {total_count} students')
                 )
                 return
 
-            # Perform actual import
-            created_count = 0
-            updated_count = 0
-
-            with transaction.atomic():
-                for row in students_data:
-                    student, created = Student.objects.update_or_create(
-                        roll=row['roll'],
-                        defaults={
-                            'name': row['name'],
-                            'batch_code': row['batch_code'],
-                            'dept_code': row['dept_code'],
-                            'serial': row['serial'],
-                            'year': row['year'],
-                            'department': row.get('department'),
-                            'extra': row.get('extra'),
-                        }
-                    )
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
-
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'Successfully imported {len(students_data)} students. '
+                    f'Successfully imported {total_count} students. '
                     f'Created: {created_count}, Updated: {updated_count}'
                 )
             )
 
         except Exception as e:
             raise CommandError(f'Error importing students: {str(e)}')
+
+    def _write_batch(self, batch, seen_rolls):
+        """
+        Upsert one batch of parsed rows with a single INSERT ... ON CONFLICT
+        DO UPDATE per BATCH_SIZE rows. A roll-only existence check is kept so
+        the created/updated split can still be reported; rolls already in
+        seen_rolls (written by an earlier batch) are not counted again, and
+        the batch's rolls are added to it. Returns (created, updated).
+        """
+        rows_by_roll = {row['roll']: row for row in batch}
+        new_rolls = rows_by_roll.keys() - seen_rolls
+        updated = Student.objects.filter(roll__in=list(new_rolls)).count()
+        seen_rolls.update(new_rolls)
+
+        students = [
+            Student(roll=roll, **{field: row.get(field) for field in UPDATE_FIELDS})
+            for roll, row in rows_by_roll.items()
+        ]
+        Student.objects.bulk_create(
+            students,
+            batch_size=BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['roll'],
+            update_fields=UPDATE_FIELDS,
+        )
+        return len(new_rolls) - updated, updated
@@ -3,9 +3,13 @@ Management command to migrate existing static data to dynamic configurations.
 """
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Prefetch
 from ...models import Room, Allocation
+from ...utils.db import importer_pragmas
 from ...models_dynamic import (
-    DynamicRoom, DynamicAllocation, RoomConfiguration, AllocationConfiguration
+    DynamicRoom, DynamicAllocation, RoomConfiguration, AllocationConfiguration,
+    PATTERN_DEFAULT,
 )
 
 
@@ -37,7 +41,7 @@ class Command(BaseCommand):
                 'cols': 5,
                 'benches_per_row': 5,
                 'seats_per_bench': 2,
-                'bench_pattern': ["A", "B", "C", "A", "B"],
+                'bench_pattern': PATTERN_DEFAULT,
                 'pattern_rotation': True,
                 'is_default': False,
                 'is_active': True,
@@ -49,7 +53,7 @@ class Command(BaseCommand):
             defaults={
                 'description': "Migrated from existing static configuration",
                 'distribution_strategy': 'balanced',
-                'base_pattern': ["A", "B", "C", "A", "B"],
+                'base_pattern': PATTERN_DEFAULT,
                 'flip_lr': False,
                 'prevent_same_year_adjacent': True,
                 'prevent_same_year_vertical': True,
@@ -60,72 +64,9 @@ class Command(BaseCommand):
             }
         )
 
-        # Migrate rooms
-        self.stdout.write('\nMigrating rooms...')
-        migrated_rooms = 0
-
-        for room in Room.objects.all():
-            if dry_run:
-                self.stdout.write(f'  Would migrate: {room.name} ({room.rows}x{room.cols})')
-                migrated_rooms += 1
-                continue
-
-            dynamic_room, created = DynamicRoom.objects.get_or_create(
-                name=room.name,
-                defaults={
-                    'configuration': room_config,
-                    'custom_rows': room.rows if room.rows != 6 else None,
-                    'custom_cols': room.cols if room.cols != 5 else None,
-                    'max_capacity': room.seats_per_room if hasattr(room, 'seats_per_room') else None,
-                    'is_active': True,
-                }
-            )
-
-            if created:
-                self.stdout.write(f'  Created: {dynamic_room.name}')
-                migrated_rooms += 1
-            else:
-                self.stdout.write(f'  Already exists: {dynamic_room.name}')
-
-        # Migrate allocations
-        self.stdout.write('\nMigrating allocations...')
-        migrated_allocations = 0
-
-        for allocation in Allocation.objects.all():
-            if dry_run:
-                self.stdout.write(f'  Would migrate: {allocation.name}')
-                migrated_allocations += 1
-                continue
-
-            # Get rooms for this allocation
-            room_names = list(allocation.rooms.values_list('name', flat=True))
-            dynamic_rooms = DynamicRoom.objects.filter(name__in=room_names)
-
-            if dynamic_rooms.exists():
-                dynamic_allocation, created = DynamicAllocation.objects.get_or_create(
-                    exam=allocation.exam,
-                    name=f"{allocation.name} (Dynamic)",
-                    defaults={
-                        'room_config': room_config,
-                        'allocation_config': alloc_config,
-                        'base_pattern': allocation.base_pattern,
-                        'flip_lr': allocation.flip_lr,
-                        'random_seed': allocation.random_seed,
-                        'distribution_strategy': allocation.distribution_strategy,
-                        'uploaded_file': allocation.uploaded_file,
-                        'pdf_file': allocation.pdf_file,
-                        'status': 'completed',  # Assume existing allocations are complete
-                    }
-                )
-
-                if created:
-                    # Add rooms to the dynamic allocation
-                    dynamic_allocation.rooms.set(dynamic_rooms)
-                    dynamic_allocation.save()
-                    self.stdout.write(f'  Created: {dynamic_allocation.name}')
-                    migrated_allocations += 1
-                else:
-                    self.stdout.write(f'  Already exists: {dynamic_allocation.name}')
+        with importer_pragmas(), transaction.atomic():
+            migrated_rooms = self._migrate_rooms(room_config, dry_run)
+            migrated_allocations = self._migrate_allocations(room_config, alloc_config, dry_run)
 
         if dry_run:
             self.stdout.write(
@@ -147,3 +88,127 @@ class Command(BaseCommand):
         self.stdout.write('2. Update your templates to reference the new models')
         self.stdout.write('3. Test the dynamic allocation functionality')
         self.stdout.write('4. Gradually phase out the old static models')
+
+    def _migrate_rooms(self, room_config, dry_run):
+        """Create a DynamicRoom for every Room not migrated yet, in bulk."""
+        self.stdout.write('\nMigrating rooms...')
+        migrated_rooms = 0
+
+        existing_names = set(DynamicRoom.objects.values_list('name', flat=True))
+        new_rooms = []
+
+        for room in Room.objects.only('name', 'rows', 'cols').iterator(chunk_size=500):
+            if dry_run:
+                self.stdout.write(f'  Would migrate: {room.name} ({room.rows}x{room.cols})')
+                migrated_rooms += 1
+                continue
+
+            if room.name in existing_names:
+                self.stdout.write(f'  Already exists: {room.name}')
+                continue
+
+            existing_names.add(room.name)
+            new_rooms.append(DynamicRoom(
+                name=room.name,
+                configuration=room_config,
+                custom_rows=room.rows if room.rows != 6 else None,
+                custom_cols=room.cols if room.cols != 5 else None,
+                max_capacity=room.total_seats,
+                is_active=True,
+            ))
+
+        DynamicRoom.objects.bulk_create(new_rooms, batch_size=500)
+        for dynamic_room in new_rooms:
+            self.stdout.write(f'  Created: {dynamic_room.name}')
+            migrated_rooms += 1
+
+        return migrated_rooms
+
+    def _migrate_allocations(self, room_config, alloc_config, dry_run):
+        """
+        Create a DynamicAllocation per Allocation with a fixed number of queries:
+        rooms are prefetched, DynamicRoom ids are preloaded by name and both the
+        allocations and their M2M rows are written with bulk_create.
+
+        bulk_create skips save() and the save signals. DynamicAllocation does
+        not override save() and has no signal receivers, so nothing is lost.
+        """
+        self.stdout.write('\nMigrating allocations...')
+        migrated_allocations = 0
+
+        room_ids_by_name = dict(DynamicRoom.objects.values_list('name', 'id'))
+        existing_keys = set(DynamicAllocation.objects.values_list('exam_id', 'name'))
+        new_allocations = []
+        new_allocation_room_ids = []
+
+        allocations = Allocation.objects.prefetch_related(
+            Prefetch('rooms', queryset=Room.objects.only('name'))
+        ).only(
+            'name', 'exam', 'base_pattern', 'flip_lr', 'random_seed',
+            'distribution_strategy', 'uploaded_file', 'pdf_file',
+        )
+        for allocation in allocations.iterator(chunk_size=200):
+            if dry_run:
+                self.stdout.write(f'  Would migrate: {allocation.name}')
+                migrated_allocations += 1
+                continue
+
+            # Get rooms for this allocation
+            dynamic_room_ids = [
+                room_ids_by_name[room.name]
+                for room in allocation.rooms.all()
+                if room.name in room_ids_by_name
+            ]
+            if not dynamic_room_ids:
+                continue
+
+            name = f"{allocation.name} (Dynamic)"
+            if (allocation.exam_id, name) in existing_keys:
+                self.stdout.write(f'  Already exists: {name}')
+                continue
+
+            existing_keys.add((allocation.exam_id, name))
+            new_allocations.append(DynamicAllocation(
+                exam_id=allocation.exam_id,
+                name=name,
+                room_config=room_config,
+                allocation_config=alloc_config,
+                base_pattern=''.join(allocation.base_pattern or []) or None,
+                flip_lr=allocation.flip_lr,
+                random_seed=allocation.random_seed,
+                distribution_strategy=allocation.distribution_strategy,
+                uploaded_file=allocation.uploaded_file,
+                pdf_file=allocation.pdf_file,
+                status='completed',  # Assume existing allocations are complete
+            ))
+            new_allocation_room_ids.append(dynamic_room_ids)
+
+        DynamicAllocation.objects.bulk_create(new_allocations, batch_size=500)
+        if new_allocations and new_allocations[0].pk is None:
+            # backends that cannot return ids from a bulk insert (MySQL) leave
+            # pk unset; (exam, name) is unique among the rows just created
+            ids = {
+                (exam_id, name): pk
+                for pk, exam_id, name in DynamicAllocation.objects.filter(
+                    name__in=[a.name for a in new_allocations]
+                ).values_list('id', 'exam_id', 'name')
+            }
+            for dynamic_allocation in new_allocations:
+                dynamic_allocation.pk = ids[(dynamic_allocation.exam_id, dynamic_allocation.name)]
+
+        # Add rooms to the dynamic allocations
+        through = DynamicAllocation.rooms.through
+        through.objects.bulk_create(
+            [
+                through(dynamicallocation_id=dynamic_allocation.pk, dynamicroom_id=room_id)
+                for dynamic_allocation, room_ids in zip(new_allocations, new_allocation_room_ids)
+                for room_id in room_ids
+            ],
+            batch_size=500,
+        )
+
+        for dynamic_allocation in new_allocations:
+            self.stdout.write(f'  Created: {dynamic_allocation.name}')
+            migrated_allocations += 1
+
+        return migrated_allocations
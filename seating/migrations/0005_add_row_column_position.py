@@ -7,8 +7,8 @@ from django.core.validators import MinValueValidator
 def populate_row_column_position(apps, schema_editor):
     """Populate row, column, position for existing SeatAssignment records."""
     SeatAssignment = apps.get_model('seating', 'SeatAssignment')
-
-    for assignment in SeatAssignment.objects.all():
+    batch = []
+    for assignment in SeatAssignment.objects.select_related('room').iterator(chunk_size=2000):
         # Calculate row and column from bench_no
         # Assuming benches are numbered row-major order
         cols = assignment.room.cols
@@ -17,13 +17,18 @@ def populate_row_column_position(apps, schema_editor):
         col = (bench_no - 1) % cols + 1
 
         # Set position to seat_pos (left/right)
-        position = assignment.seat_pos
-
-        # Update the record
         assignment.row = row
         assignment.column = col
-        assignment.position = position
-        assignment.save()
+        assignment.position = assignment.seat_pos
+
+        # Write in batches instead of one UPDATE per record
+        batch.append(assignment)
+        if len(batch) == 1000:
+            SeatAssignment.objects.bulk_update(batch, ['row', 'column', 'position'])
+            batch.clear()
+
+    if batch:
+        SeatAssignment.objects.bulk_update(batch, ['row', 'column', 'position'])
 
 
 class Migration(migrations.Migration):
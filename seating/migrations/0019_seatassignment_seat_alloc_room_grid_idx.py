@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seating', '0018_auto_20260128_1949'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='seatassignment',
+            index=models.Index(fields=['allocation', 'room', 'row', 'column', 'position'], name='seat_alloc_room_grid_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-16 09:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seating', '0019_seatassignment_seat_alloc_room_grid_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['upload_batch_id'], name='seating_stu_upload__28a805_idx'),
+        ),
+    ]
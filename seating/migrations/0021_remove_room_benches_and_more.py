@@ -0,0 +1,25 @@
+# Generated by Django 5.0.7 on 2026-10-16 10:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seating', '0020_student_seating_stu_upload__28a805_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='room',
+            name='benches',
+        ),
+        migrations.RemoveField(
+            model_name='room',
+            name='benches_per_room',
+        ),
+        migrations.RemoveField(
+            model_name='room',
+            name='seats_per_room',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-16 10:40
+
+from django.db import migrations, models
+import seating.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seating', '0021_remove_room_benches_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='allocation',
+            name='base_pattern',
+            field=models.JSONField(default=seating.models._default_base_pattern, help_text='Base pattern for bench types'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-16 11:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('seating', '0022_alter_allocation_base_pattern'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='seatassignment',
+            index=models.Index(fields=['allocation', 'room', 'bench_no'], name='seat_alloc_room_bench_idx'),
+        ),
+    ]
@@ -1,6 +1,5 @@
 from django.db import models
 from django.core.validators import MinValueValidator
-from django.core.exceptions import ValidationError
 import json
 
 
@@ -90,6 +89,7 @@ class Student(models.Model):
             models.Index(fields=['year']),
             models.Index(fields=['roll']),
             models.Index(fields=['batch_code']),
+            models.Index(fields=['upload_batch_id']),
         ]
 
 
@@ -125,18 +125,11 @@ class Room(models.Model):
     name = models.CharField(max_length=50, unique=True, help_text="Unique room identifier")
     rows = models.PositiveSmallIntegerField(default=6, help_text="Number of rows")
     cols = models.PositiveSmallIntegerField(default=5, help_text="Number of columns")
-    benches = models.PositiveIntegerField(default=30, editable=False)
-    benches_per_room = models.IntegerField(default=30, validators=[MinValueValidator(1)], help_text="Total benches in room")
-    seats_per_room = models.IntegerField(default=60, validators=[MinValueValidator(1)], help_text="Total seats in room")
 
     def __str__(self):
         return f"{self.name} ({self.rows}x{self.cols})"
 
-    def clean(self):
-        """Validate that benches_per_room equals rows * cols."""
-        if self.benches_per_room != self.rows * self.cols:
-            raise ValidationError(f"benches_per_room ({self.benches_per_room}) must equal rows * cols ({self.rows * self.cols})")
-
+    # Bench and seat counts are derived from rows * cols rather than stored
     @property
     def total_benches(self):
         return self.rows * self.cols
@@ -149,6 +142,10 @@ class Room(models.Model):
         ordering = ['name']
 
 
+def _default_base_pattern():
+    return ["A", "B", "C"]
+
+
 class Allocation(models.Model):
     """
     Allocation model representing seating arrangements for exams.
@@ -172,7 +169,7 @@ class Allocation(models.Model):
     seats_per_room = models.IntegerField(null=True, blank=True, validators=[MinValueValidator(1)], help_text="Seats per room (optional)")
 
     # Algorithm parameters
-    base_pattern = models.JSONField(default=list, help_text="Base pattern for bench types")
+    base_pattern = models.JSONField(default=_default_base_pattern, help_text="Base pattern for bench types")
     flip_lr = models.BooleanField(default=False, help_text="Flip left-right seating")
     random_seed = models.IntegerField(null=True, blank=True, help_text="Random seed for reproducibility")
     distribution_strategy = models.CharField(
@@ -215,8 +212,10 @@ class Allocation(models.Model):
         return f"{self.name} - {self.exam.name} ({self.created_at.date()})"
 
     def save(self, *args, **kwargs):
+        # the field default covers omitted patterns; this also catches an
+        # explicit [] or None, which would leave the bench-type cycle empty
         if not self.base_pattern:
-            self.base_pattern = ["A", "B", "C"]
+            self.base_pattern = _default_base_pattern()
         super().save(*args, **kwargs)
 
     class Meta:
@@ -260,4 +259,6 @@ class SeatAssignment(models.Model):
         indexes = [
             models.Index(fields=['allocation', 'room']),
             models.Index(fields=['student']),
+            models.Index(fields=['allocation', 'room', 'row', 'column', 'position'], name='seat_alloc_room_grid_idx'),
+            models.Index(fields=['allocation', 'room', 'bench_no'], name='seat_alloc_room_bench_idx'),
         ]
@@ -4,9 +4,58 @@ These models provide flexible configuration options for room layouts,
 allocation algorithms, and system settings.
 """
 
-from django.db import models
-from django.core.validators import MinValueValidator
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.core.cache import cache
+from django.core.validators import MinValueValidator, RegexValidator
 import json
+import time
+
+
+# Bench-type patterns are stored as compact strings, one letter per bench
+PATTERN_DEFAULT = "ABCAB"
+validate_bench_pattern = RegexValidator(
+    r'^[ABC]+\Z', "Pattern must be one or more of the bench types A, B and C, e.g. 'ABCAB'."
+)
+
+
+# Default RoomConfiguration / AllocationConfiguration rows and parsed
+# SystemConfiguration values are kept in Django's cache. Every key includes a
+# version number that is bumped whenever a configuration row is saved or
+# deleted, so a shared cache backend sees changes at once. The timeout bounds
+# staleness where that cannot reach: per-process backends such as the
+# default LocMemCache (one copy per worker) and writes that skip the signals
+# (QuerySet.update(), bulk operations).
+CONFIG_CACHE_TIMEOUT = 60
+_CONFIG_VERSION_KEY = 'seating:config:version'
+_NOT_CACHED = object()
+
+
+def _config_cache_key(kind, name):
+    # seeded from the clock so a version evicted from the cache is not reused
+    version = cache.get_or_set(_CONFIG_VERSION_KEY, time.time_ns, timeout=None)
+    return f'seating:config:{version}:{kind}:{name}'
+
+
+def _bump_config_version():
+    try:
+        cache.incr(_CONFIG_VERSION_KEY)
+    except ValueError:
+        cache.set(_CONFIG_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def _get_default_config(model, fields=None):
+    key = _config_cache_key('default', model._meta.label_lower)
+    config = cache.get(key, _NOT_CACHED)
+    if config is _NOT_CACHED:
+        qs = model.objects.filter(is_default=True, is_active=True)
+        if fields:
+            qs = qs.only(*fields)
+        config = qs.first()
+        cache.set(key, config, CONFIG_CACHE_TIMEOUT)
+    return config
 
 
 class SystemConfiguration(models.Model):
@@ -23,15 +72,37 @@ class SystemConfiguration(models.Model):
 
     @classmethod
     def get_value(cls, key, default=None):
-        """Get configuration value by key"""
-        try:
-            config = cls.objects.get(key=key, is_active=True)
-            return json.loads(config.value)
-        except (cls.DoesNotExist, json.JSONDecodeError):
-            return default
+        """Get configuration value by key (cached, see CONFIG_CACHE_TIMEOUT)"""
+        return cls.get_many([key], default)[key]
+
+    @classmethod
+    def get_many(cls, keys, default=None):
+        """Get several configuration values as {key: value}, querying cache misses in one SELECT"""
+        # cached entries are (value,), or () for a key with no active row or
+        # invalid JSON so the caller's default still applies
+        cache_keys = {key: _config_cache_key('system', key) for key in keys}
+        found = cache.get_many(cache_keys.values())
+        entries = {key: found[cache_key] for key, cache_key in cache_keys.items() if cache_key in found}
+
+        misses = [key for key in keys if key not in entries]
+        if misses:
+            loaded = dict.fromkeys(misses, ())
+            rows = cls.objects.filter(key__in=misses, is_active=True).values_list('key', 'value')
+            for key, raw in rows:
+                try:
+                    loaded[key] = (json.loads(raw),)
+                except json.JSONDecodeError:
+                    pass
+            cache.set_many({cache_keys[key]: entry for key, entry in loaded.items()}, CONFIG_CACHE_TIMEOUT)
+            entries.update(loaded)
+
+        return {key: entries[key][0] if entries[key] else default for key in keys}
 
     class Meta:
         ordering = ['key']
+        indexes = [
+            models.Index(fields=['key'], condition=Q(is_active=True), name='sysconf_active_key'),
+        ]
 
 
 class RoomConfiguration(models.Model):
@@ -48,13 +119,16 @@ class RoomConfiguration(models.Model):
     seats_per_bench = models.IntegerField(default=2, validators=[MinValueValidator(1)], help_text="Seats per bench")
 
     # Bench type patterns
-    bench_pattern = models.JSONField(default=list, help_text="Pattern of bench types (A, B, C)")
+    bench_pattern = models.CharField(max_length=32, default=PATTERN_DEFAULT, validators=[validate_bench_pattern], help_text="Pattern of bench types (A, B, C), e.g. 'ABCAB'")
     pattern_rotation = models.BooleanField(default=True, help_text="Whether to rotate pattern across rooms")
 
     # Constraints
     max_students_per_room = models.IntegerField(null=True, blank=True, help_text="Maximum students per room")
     min_students_per_room = models.IntegerField(null=True, blank=True, help_text="Minimum students per room")
 
+    # Derived from rows * cols * seats_per_bench in save()
+    total_seats = models.IntegerField(default=60, editable=False, help_text="Total seats (computed)")
+
     is_default = models.BooleanField(default=False, help_text="Whether this is the default configuration")
     is_active = models.BooleanField(default=True, help_text="Whether this configuration is active")
 
@@ -65,20 +139,27 @@ class RoomConfiguration(models.Model):
     def total_benches(self):
         return self.rows * self.cols
 
-    @property
-    def total_seats(self):
-        return self.total_benches * self.seats_per_bench
+    @classmethod
+    def get_default(cls):
+        """Get the active default configuration (cached until a configuration changes)"""
+        return _get_default_config(cls)
 
     def save(self, *args, **kwargs):
-        if self.is_default:
-            # Ensure only one default configuration
-            RoomConfiguration.objects.filter(is_default=True).update(is_default=False)
-        if not self.bench_pattern:
-            self.bench_pattern = ["A", "B", "C", "A", "B"]
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            if self.is_default:
+                # Ensure only one default configuration; this row is left alone so
+                # re-saving the current default doesn't rewrite it
+                RoomConfiguration.objects.filter(is_default=True).exclude(pk=self.pk).update(is_default=False)
+            if not self.bench_pattern:
+                self.bench_pattern = PATTERN_DEFAULT
+            self.total_seats = self.rows * self.cols * self.seats_per_bench
+            super().save(*args, **kwargs)
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['is_default'], condition=Q(is_default=True, is_active=True), name='room_default_partial'),
+        ]
 
 
 class AllocationConfiguration(models.Model):
@@ -104,7 +185,7 @@ class AllocationConfiguration(models.Model):
     )
 
     # Algorithm parameters
-    base_pattern = models.JSONField(default=list, help_text="Base pattern for bench types")
+    base_pattern = models.CharField(max_length=32, default=PATTERN_DEFAULT, validators=[validate_bench_pattern], help_text="Base pattern for bench types, e.g. 'ABCAB'")
     flip_lr = models.BooleanField(default=False, help_text="Flip left-right seating")
     random_seed = models.IntegerField(null=True, blank=True, help_text="Random seed for reproducibility")
 
@@ -120,19 +201,32 @@ class AllocationConfiguration(models.Model):
     is_default = models.BooleanField(default=False, help_text="Whether this is the default configuration")
     is_active = models.BooleanField(default=True, help_text="Whether this configuration is active")
 
+    # Columns read from the default configuration by DynamicAllocation.get_*()
+    DEFAULT_FIELDS = ('id', 'distribution_strategy', 'base_pattern', 'flip_lr')
+
     def __str__(self):
         return f"{self.name} ({self.distribution_strategy})"
 
+    @classmethod
+    def get_default(cls):
+        """Get the active default configuration (cached until a configuration changes)"""
+        return _get_default_config(cls, cls.DEFAULT_FIELDS)
+
     def save(self, *args, **kwargs):
-        if self.is_default:
-            # Ensure only one default configuration
-            AllocationConfiguration.objects.filter(is_default=True).update(is_default=False)
-        if not self.base_pattern:
-            self.base_pattern = ["A", "B", "C", "A", "B"]
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            if self.is_default:
+                # Ensure only one default configuration; this row is left alone so
+                # re-saving the current default doesn't rewrite it
+                AllocationConfiguration.objects.filter(is_default=True).exclude(pk=self.pk).update(is_default=False)
+            if not self.base_pattern:
+                self.base_pattern = PATTERN_DEFAULT
+            super().save(*args, **kwargs)
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['is_default'], condition=Q(is_default=True, is_active=True), name='alloc_default_partial'),
+        ]
 
 
 class DynamicRoom(models.Model):
@@ -225,7 +319,7 @@ class DynamicAllocation(models.Model):
     seats_per_room = models.IntegerField(null=True, blank=True, default=60, validators=[MinValueValidator(1)], help_text="Seats per room")
 
     # Algorithm parameters (override config if needed)
-    base_pattern = models.JSONField(null=True, blank=True, help_text="Base pattern for bench types")
+    base_pattern = models.CharField(max_length=32, null=True, blank=True, validators=[validate_bench_pattern], help_text="Base pattern for bench types, e.g. 'ABCAB'")
     flip_lr = models.BooleanField(null=True, blank=True, help_text="Flip left-right seating")
     random_seed = models.IntegerField(null=True, blank=True, help_text="Random seed for reproducibility")
     distribution_strategy = models.CharField(
@@ -267,18 +361,18 @@ class DynamicAllocation(models.Model):
 
     def get_room_config(self):
         """Get effective room configuration"""
-        return self.room_config or RoomConfiguration.objects.filter(is_default=True, is_active=True).first()
+        return self.room_config or RoomConfiguration.get_default()
 
     def get_allocation_config(self):
         """Get effective allocation configuration"""
-        return self.allocation_config or AllocationConfiguration.objects.filter(is_default=True, is_active=True).first()
+        return self.allocation_config or AllocationConfiguration.get_default()
 
     def get_base_pattern(self):
-        """Get effective base pattern"""
+        """Get effective base pattern as a string of bench-type letters"""
         if self.base_pattern:
             return self.base_pattern
         config = self.get_allocation_config()
-        return config.base_pattern if config else ["A", "B", "C", "A", "B"]
+        return config.base_pattern if config else PATTERN_DEFAULT
 
     def get_distribution_strategy(self):
         """Get effective distribution strategy"""
@@ -296,3 +390,18 @@ class DynamicAllocation(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['exam', '-created_at'], name='dynalloc_exam_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='dynalloc_status_created_idx'),
+        ]
+
+
+@receiver(post_save, sender=RoomConfiguration)
+@receiver(post_delete, sender=RoomConfiguration)
+@receiver(post_save, sender=AllocationConfiguration)
+@receiver(post_delete, sender=AllocationConfiguration)
+@receiver(post_save, sender=SystemConfiguration)
+@receiver(post_delete, sender=SystemConfiguration)
+def _clear_config_cache(sender, **kwargs):
+    # all cached configuration shares one version, so any change drops it all
+    _bump_config_version()
@@ -1,26 +1,46 @@
+import os
+
+from django.db.models import Prefetch
 from rest_framework import serializers
 from .models import Student, Exam, Room, Allocation, SeatAssignment, Subject
 
+_VALID_UPLOAD_EXTS = frozenset({'.xlsx', '.xls', '.csv'})
+
+# Choice labels resolved once; used instead of get_FOO_display() per row
+_STUDENT_YEAR_LABELS = dict(Student._meta.get_field('year').flatchoices)
+_EXAM_YEAR_LABELS = dict(Exam._meta.get_field('year').flatchoices)
+_BENCH_TYPE_LABELS = dict(SeatAssignment._meta.get_field('bench_type').flatchoices)
+_SEAT_POS_LABELS = dict(SeatAssignment._meta.get_field('seat_pos').flatchoices)
+
 
 class StudentSerializer(serializers.ModelSerializer):
-    year_display = serializers.CharField(source='get_year_display', read_only=True)
+    year_display = serializers.SerializerMethodField()
 
     class Meta:
         model = Student
         fields = ['id', 'roll', 'name', 'year', 'year_display', 'department', 'extra']
 
+    def get_year_display(self, obj):
+        return _STUDENT_YEAR_LABELS.get(obj.year, obj.year)
+
 
 class ExamSerializer(serializers.ModelSerializer):
-    year_display = serializers.CharField(source='get_year_display', read_only=True)
+    year_display = serializers.SerializerMethodField()
 
     class Meta:
         model = Exam
         fields = ['id', 'name', 'date', 'year', 'year_display']
 
+    def get_year_display(self, obj):
+        return _EXAM_YEAR_LABELS.get(obj.year, obj.year)
+
 
 class RoomSerializer(serializers.ModelSerializer):
     total_benches = serializers.ReadOnlyField()
     total_seats = serializers.ReadOnlyField()
+    # Kept for API compatibility; derived from rows * cols
+    benches_per_room = serializers.ReadOnlyField(source='total_benches')
+    seats_per_room = serializers.ReadOnlyField(source='total_seats')
 
     class Meta:
         model = Room
@@ -30,8 +50,8 @@ class RoomSerializer(serializers.ModelSerializer):
 class SeatAssignmentSerializer(serializers.ModelSerializer):
     student = StudentSerializer(read_only=True)
     room = RoomSerializer(read_only=True)
-    bench_type_display = serializers.CharField(source='get_bench_type_display', read_only=True)
-    seat_pos_display = serializers.CharField(source='get_seat_pos_display', read_only=True)
+    bench_type_display = serializers.SerializerMethodField()
+    seat_pos_display = serializers.SerializerMethodField()
 
     class Meta:
         model = SeatAssignment
@@ -40,11 +60,58 @@ class SeatAssignmentSerializer(serializers.ModelSerializer):
             'bench_type', 'bench_type_display', 'student'
         ]
 
+    def get_bench_type_display(self, obj):
+        return _BENCH_TYPE_LABELS.get(obj.bench_type, obj.bench_type)
+
+    def get_seat_pos_display(self, obj):
+        return _SEAT_POS_LABELS.get(obj.seat_pos, obj.seat_pos)
+
+
+# Flat columns read by iter_seat_assignment_rows()
+SEAT_ASSIGNMENT_VALUES = (
+    'id', 'allocation_id', 'room_id', 'bench_no', 'seat_pos', 'bench_type',
+    'student_id', 'student__roll', 'student__name', 'student__year',
+    'student__department', 'student__extra',
+)
+
+
+def iter_seat_assignment_rows(queryset, rooms_by_id, chunk_size=1000):
+    """
+    Yield SeatAssignmentSerializer-shaped dicts for assignments straight from
+    values() rows, so large allocations are never held as model instances.
+    rooms_by_id maps room id to the already serialized room, shared by every
+    row in that room.
+    """
+    rows = queryset.values(*SEAT_ASSIGNMENT_VALUES).iterator(chunk_size=chunk_size)
+    for row in rows:
+        student = None
+        if row['student_id'] is not None:
+            student = {
+                'id': row['student_id'],
+                'roll': row['student__roll'],
+                'name': row['student__name'],
+                'year': row['student__year'],
+                'year_display': _STUDENT_YEAR_LABELS.get(row['student__year'], row['student__year']),
+                'department': row['student__department'],
+                'extra': row['student__extra'],
+            }
+        yield {
+            'id': row['id'],
+            'allocation': row['allocation_id'],
+            'room': rooms_by_id[row['room_id']],
+            'bench_no': row['bench_no'],
+            'seat_pos': row['seat_pos'],
+            'seat_pos_display': _SEAT_POS_LABELS.get(row['seat_pos'], row['seat_pos']),
+            'bench_type': row['bench_type'],
+            'bench_type_display': _BENCH_TYPE_LABELS.get(row['bench_type'], row['bench_type']),
+            'student': student,
+        }
+
 
 class AllocationSerializer(serializers.ModelSerializer):
     exam = ExamSerializer(read_only=True)
     rooms = RoomSerializer(many=True, read_only=True)
-    seat_assignments = SeatAssignmentSerializer(source='seat_assignments', many=True, read_only=True)
+    seat_assignments = SeatAssignmentSerializer(many=True, read_only=True)
     distribution_strategy_display = serializers.CharField(source='get_distribution_strategy_display', read_only=True)
 
     class Meta:
@@ -55,13 +122,62 @@ class AllocationSerializer(serializers.ModelSerializer):
             'uploaded_file', 'pdf_file', 'created_at', 'updated_at', 'seat_assignments'
         ]
 
+    def __init__(self, *args, fields=None, **kwargs):
+        """fields: optional iterable limiting the rendered fields (sparse fieldset)."""
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @staticmethod
+    def requested_fields(request):
+        """Parse ?fields=id,name,... into a list, or None when not given."""
+        param = request.query_params.get('fields')
+        if not param:
+            return None
+        return [name.strip() for name in param.split(',') if name.strip()]
+
+    @staticmethod
+    def setup_eager_loading(queryset, fields=None):
+        """
+        Load exam, rooms and assignments (with student/room) in a fixed number of
+        queries, skipping relations that fields (see requested_fields) leaves out.
+        """
+        if fields is not None:
+            if 'exam' in fields:
+                queryset = queryset.select_related('exam')
+            if 'rooms' in fields:
+                queryset = queryset.prefetch_related('rooms')
+            if 'seat_assignments' not in fields:
+                return queryset
+        else:
+            queryset = queryset.select_related('exam').prefetch_related('rooms')
+        return queryset.prefetch_related(
+            Prefetch(
+                'seat_assignments',
+                # keep allocation/room/student FKs so Django can stitch the prefetch
+                queryset=SeatAssignment.objects.select_related('student', 'room').only(
+                    'id', 'allocation_id', 'room_id', 'student_id',
+                    'bench_no', 'seat_pos', 'bench_type',
+                    'student__id', 'student__roll', 'student__name', 'student__year',
+                    'student__department', 'student__extra',
+                    'room__id', 'room__name', 'room__rows', 'room__cols',
+                ),
+            ),
+        )
+
 
 class AllocationCreateSerializer(serializers.Serializer):
     exam_id = serializers.IntegerField()
     name = serializers.CharField(max_length=200, required=False)
+    exam_date = serializers.DateField(input_formats=['%Y-%m-%d', 'iso-8601'])
     num_rooms = serializers.IntegerField(min_value=1, default=1)
     seats_per_room = serializers.IntegerField(min_value=1, default=60, required=False)
-    base_pattern = serializers.ListField(child=serializers.CharField(), required=False)
+    base_pattern = serializers.ListField(
+        child=serializers.ChoiceField(choices=[code for code, _ in SeatAssignment.BENCH_TYPE_CHOICES]),
+        allow_empty=False,
+        required=False,
+    )
     flip_lr = serializers.BooleanField(default=False)
     random_seed = serializers.IntegerField(required=False, allow_null=True)
     distribution_strategy = serializers.ChoiceField(
@@ -71,7 +187,8 @@ class AllocationCreateSerializer(serializers.Serializer):
 
     def validate_exam_id(self, value):
         try:
-            Exam.objects.get(id=value)
+            # kept for validate() so the default name needs no second query
+            self._exam = Exam.objects.only('id', 'name').get(id=value)
         except Exam.DoesNotExist:
             raise serializers.ValidationError("Exam does not exist.")
         return value
@@ -79,8 +196,7 @@ class AllocationCreateSerializer(serializers.Serializer):
     def validate(self, data):
         # Set default name if not provided
         if 'name' not in data:
-            exam = Exam.objects.get(id=data['exam_id'])
-            data['name'] = f"Allocation for {exam.name}"
+            data['name'] = f"Allocation for {self._exam.name}"
         return data
 
 
@@ -95,8 +211,13 @@ class AllocationPreviewSerializer(serializers.ModelSerializer):
             'rows_per_room', 'cols_per_room', 'seats_per_room', 'created_at'
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return queryset.select_related('exam').prefetch_related('rooms')
+
 
 class SubjectSerializer(serializers.ModelSerializer):
+    # Subject overrides get_semester_display(), so its label is not the choice label
     semester_display = serializers.CharField(source='get_semester_display', read_only=True)
 
     class Meta:
@@ -108,6 +229,6 @@ class ExcelUploadSerializer(serializers.Serializer):
     excel_file = serializers.FileField()
 
     def validate_excel_file(self, value):
-        if not value.name.lower().endswith(('.xlsx', '.xls', '.csv')):
+        if os.path.splitext(value.name)[1].lower() not in _VALID_UPLOAD_EXTS:
             raise serializers.ValidationError("File must be an Excel file (.xlsx, .xls) or CSV file (.csv)")
         return value
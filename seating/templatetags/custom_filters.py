@@ -2,6 +2,19 @@ from django import template
 
 register = template.Library()
 
+_SUFFIX = ['th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th']
+_TEENS = {11, 12, 13}
+
+
+def _ordinal_str(value):
+    suffix = 'th' if value % 100 in _TEENS else _SUFFIX[value % 10]
+    return f"{value}{suffix}"
+
+
+# precomputed strings for the common range (years, semesters, bench numbers)
+_ORDINAL_STR = {i: _ordinal_str(i) for i in range(1, 201)}
+
+
 @register.filter
 def ordinal(value):
     """
@@ -13,9 +26,4 @@ def ordinal(value):
     except (ValueError, TypeError):
         return value
 
-    if 11 <= (value % 100) <= 13:
-        suffix = 'th'
-    else:
-        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(value % 10, 'th')
-
-    return f"{value}{suffix}"
+    return _ORDINAL_STR.get(value) or _ordinal_str(value)
@@ -0,0 +1,92 @@
+import datetime
+
+from django.test import TestCase
+
+from seating.models import Allocation, Exam, Room, SeatAssignment, Student
+from seating.utils.allocation import generate_allocation
+
+
+class GenerateAllocationPairingTests(TestCase):
+    """Pins the seat map produced while groups run out and pairings are rebuilt."""
+
+    def setUp(self):
+        self.exam = Exam.objects.create(name='Midterm', date=datetime.date(2024, 1, 1))
+        self.rooms = [Room.objects.create(name=f'R{i}', rows=1, cols=2) for i in range(1, 9)]
+        counts = {(1, 'A'): 2, (1, 'B'): 2, (2, 'A'): 2, (2, 'B'): 2, (3, 'A'): 2, (3, 'B'): 6}
+        for (year, section), count in counts.items():
+            for serial in range(1, count + 1):
+                Student.objects.create(
+                    roll=f'{year}{section}{serial:02d}',
+                    name=f'Student {year}{section}{serial:02d}',
+                    year=year,
+                    section=section,
+                )
+        self.allocation = Allocation.objects.create(exam=self.exam, num_rooms=len(self.rooms))
+        self.allocation.rooms.set(self.rooms)
+
+    def seat_map(self):
+        return list(
+            SeatAssignment.objects.filter(allocation=self.allocation)
+            .order_by('room__name', 'bench_no', 'seat_pos')
+            .values_list('room__name', 'bench_no', 'seat_pos', 'student__roll')
+        )
+
+    def test_pairing_cycle_resumes_at_same_index_after_group_runs_out(self):
+        generate_allocation(
+            allocation=self.allocation,
+            student_queryset=Student.objects.all(),
+            rooms=self.rooms,
+            distribution_strategy='cycle',
+        )
+        self.assertEqual(self.seat_map(), [
+            ('R1', 1, 'left', '1A01'), ('R1', 1, 'right', '2B02'),
+            ('R2', 1, 'left', '2B01'), ('R2', 1, 'right', '3A02'),
+            ('R3', 1, 'left', '2A01'), ('R3', 1, 'right', '3B04'),
+            ('R3', 2, 'right', '3B05'),
+            ('R4', 1, 'left', '3B01'), ('R4', 1, 'right', '1A02'),
+            ('R4', 2, 'left', '3B02'),
+            ('R5', 1, 'left', '3A01'), ('R5', 1, 'right', '1B02'),
+            ('R6', 1, 'left', '2A02'), ('R6', 1, 'right', '3B03'),
+            ('R7', 1, 'left', '1B01'), ('R7', 1, 'right', '3B06'),
+        ])
+
+
+class SeatAssignmentWriteTests(TestCase):
+    """Seats built by generate_allocation read back intact through the ORM."""
+
+    def test_seat_fields_round_trip(self):
+        exam = Exam.objects.create(name='Final', date=datetime.date(2024, 5, 1))
+        room = Room.objects.create(name='Hall', rows=2, cols=2)
+        Student.objects.create(roll='1A01', name='One', year=1, section='A')
+        Student.objects.create(roll='2A01', name='Two', year=2, section='A')
+        allocation = Allocation.objects.create(exam=exam, num_rooms=1)
+        allocation.rooms.set([room])
+
+        result = generate_allocation(
+            allocation=allocation,
+            student_queryset=Student.objects.all(),
+            rooms=[room],
+            distribution_strategy='cycle',
+        )
+
+        self.assertEqual(result['total_seats'], 2)
+        seats = list(
+            SeatAssignment.objects.filter(allocation=allocation)
+            .order_by('seat_pos')
+            .values_list('room_id', 'bench_no', 'seat_pos', 'position', 'bench_type', 'row', 'column', 'student__roll')
+        )
+        self.assertEqual(seats, [
+            (room.id, 1, 'left', 'left', 'A', 1, 1, '1A01'),
+            (room.id, 1, 'right', 'right', 'A', 1, 1, '2A01'),
+        ])
+
+
+class AllocationBasePatternTests(TestCase):
+
+    def test_empty_pattern_falls_back_to_default_on_save(self):
+        exam = Exam.objects.create(name='Midterm', date=datetime.date(2024, 1, 1))
+        for pattern in ([], None):
+            with self.subTest(pattern=pattern):
+                allocation = Allocation.objects.create(exam=exam, num_rooms=1, base_pattern=pattern)
+                allocation.refresh_from_db()
+                self.assertEqual(allocation.base_pattern, ['A', 'B', 'C'])
@@ -0,0 +1,65 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+
+from seating.models import Allocation, Exam, Room
+from seating.models_dynamic import (
+    AllocationConfiguration, DynamicAllocation, DynamicRoom, RoomConfiguration,
+)
+
+# models_dynamic has no migrations yet, so the test database lacks its tables
+DYNAMIC_MODELS = (RoomConfiguration, AllocationConfiguration, DynamicRoom, DynamicAllocation)
+
+
+class MigrateToDynamicTests(TransactionTestCase):
+    """
+    migrate_to_dynamic bulk-creates allocations, so their room links are
+    written by hand. TransactionTestCase because importer_pragmas cannot
+    change SQLite's synchronous setting inside a transaction.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as editor:
+            for model in DYNAMIC_MODELS:
+                editor.create_model(model)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as editor:
+            for model in reversed(DYNAMIC_MODELS):
+                editor.delete_model(model)
+
+    def setUp(self):
+        exam = Exam.objects.create(name='Midterm', date=datetime.date(2024, 1, 1))
+        self.rooms = [Room.objects.create(name=f'R{i}', rows=6, cols=5) for i in range(1, 4)]
+        first = Allocation.objects.create(exam=exam, name='Morning', num_rooms=2)
+        first.rooms.set(self.rooms[:2])
+        second = Allocation.objects.create(exam=exam, name='Evening', num_rooms=1)
+        second.rooms.set(self.rooms[2:])
+
+    def migrated_rooms(self):
+        return {
+            allocation.name: sorted(room.name for room in allocation.rooms.all())
+            for allocation in DynamicAllocation.objects.prefetch_related('rooms')
+        }
+
+    def test_migrated_allocations_keep_their_rooms(self):
+        call_command('migrate_to_dynamic', stdout=StringIO())
+
+        self.assertEqual(self.migrated_rooms(), {
+            'Morning (Dynamic)': ['R1', 'R2'],
+            'Evening (Dynamic)': ['R3'],
+        })
+
+    def test_rerun_does_not_duplicate_allocations_or_rooms(self):
+        call_command('migrate_to_dynamic', stdout=StringIO())
+        call_command('migrate_to_dynamic', stdout=StringIO())
+
+        self.assertEqual(DynamicAllocation.objects.count(), 2)
+        self.assertEqual(DynamicAllocation.rooms.through.objects.count(), 3)
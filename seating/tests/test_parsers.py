@@ -0,0 +1,112 @@
+import os
+import tempfile
+from io import BytesIO
+from unittest import mock, skipUnless
+
+import openpyxl
+from django.test import SimpleTestCase, TestCase
+
+from seating.models import BatchMapping
+from seating.utils import parsers
+from seating.utils.parsers import batch_to_year, iter_student_file_batches, parse_student_dataframe, pd
+
+
+@skipUnless(pd is not None, 'pandas is not installed')
+class ParseStudentDataFrameTests(SimpleTestCase):
+
+    def test_blank_optional_columns_match_on_fast_and_fallback_rows(self):
+        # 'II' passes the vectorised masks; the float year 2.0 does not and
+        # is parsed by parse_student_row instead
+        df = pd.DataFrame({
+            'roll': ['231CS001', '231CS002'],
+            'name': ['Fast', 'Fallback'],
+            'year': ['II', 2.0],
+            'department': [None, None],
+            'section': [None, None],
+            'extra': [None, None],
+        })
+        df[['department', 'section', 'extra']] = df[['department', 'section', 'extra']].astype(float)
+
+        students, invalid = parse_student_dataframe(df, batch_map={})
+
+        self.assertEqual(invalid, [])
+        self.assertEqual([s['roll'] for s in students], ['231CS001', '231CS002'])
+        for student in students:
+            self.assertEqual(student['year'], 2)
+            self.assertIsNone(student['department'])
+            self.assertIsNone(student['section'])
+            self.assertIsNone(student['extra'])
+
+    def test_batch_without_a_valid_roll_reports_each_row(self):
+        # no roll matches, so every extracted group column is all-NaN
+        df = pd.DataFrame({'roll': ['bad', 'worse'], 'name': ['Ann', 'Bea']})
+
+        students, invalid = parse_student_dataframe(df, batch_map={})
+
+        self.assertEqual(students, [])
+        self.assertEqual(
+            [(r['row_number'], r['error']) for r in invalid],
+            [(2, 'Invalid roll format: bad'), (3, 'Invalid roll format: worse')],
+        )
+
+
+@skipUnless(pd is not None, 'pandas is not installed')
+class IterStudentFileBatchesTests(SimpleTestCase):
+    # pandas writes an integer column holding a NaN as floats: 2.0, not 2
+    CSV = b'roll,name,year\n231CS001,Ann,2.0\n231CS002,Bea,\n'
+
+    def parse(self, source):
+        students, invalid = [], []
+        for valid, bad in iter_student_file_batches(source, batch_map={'231': 3}):
+            students.extend(valid)
+            invalid.extend(bad)
+        return invalid, [(s['roll'], s['year']) for s in students]
+
+    def test_float_years_parse_the_same_from_an_upload_and_a_path(self):
+        expected = ([], [('231CS001', 2), ('231CS002', 3)])
+        self.assertEqual(self.parse(BytesIO(self.CSV)), expected)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'students.csv')
+            with open(path, 'wb') as f:
+                f.write(self.CSV)
+            self.assertEqual(self.parse(path), expected)
+
+    def test_xlsx_is_streamed_in_batches_with_sheet_row_numbers(self):
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['roll', 'name', 'year'])
+        ws.append(['231CS001', 'Ann', 2])
+        ws.append(['bad', 'Bea', None])
+        ws.append([None, None, None])
+        ws.append(['231CS003', 'Cal', 'III'])
+        ws.append([None, None, None])
+        buf = BytesIO()
+        wb.save(buf)
+        buf.seek(0)
+
+        with mock.patch.object(parsers.pd, 'read_excel') as read_excel:
+            batches = list(iter_student_file_batches(buf, batch_map={}, batch_size=2))
+        read_excel.assert_not_called()
+
+        self.assertEqual(len(batches), 2)
+        students = [s for valid, _ in batches for s in valid]
+        invalid = [r for _, bad in batches for r in bad]
+        self.assertEqual([(s['roll'], s['year']) for s in students], [('231CS001', 2), ('231CS003', 3)])
+        self.assertEqual(
+            [(r['row_number'], r['error']) for r in invalid],
+            [(3, 'Invalid roll format: bad'), (4, 'Missing roll or name')],
+        )
+
+
+class BatchToYearTests(TestCase):
+
+    def test_cached_batch_map_follows_mapping_changes(self):
+        BatchMapping.objects.create(batch_code='231', year=2)
+        self.assertEqual(batch_to_year('231'), 2)
+
+        BatchMapping.objects.update_or_create(batch_code='231', defaults={'year': 3})
+        self.assertEqual(batch_to_year('231'), 3)
+
+        BatchMapping.objects.filter(batch_code='231').delete()
+        self.assertEqual(batch_to_year('231'), 1)
@@ -0,0 +1,52 @@
+import datetime
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+
+from seating.models import Exam
+from seating.models_dynamic import AllocationConfiguration, DynamicAllocation, RoomConfiguration
+from seating.serializers import AllocationCreateSerializer
+
+
+class AllocationCreateSerializerPatternTests(TestCase):
+
+    def setUp(self):
+        self.exam = Exam.objects.create(name='Midterm', date=datetime.date(2024, 1, 1))
+
+    def serializer(self, **data):
+        return AllocationCreateSerializer(data={'exam_id': self.exam.id, 'exam_date': '2024-01-01', **data})
+
+    def test_pattern_of_bench_types_is_accepted(self):
+        serializer = self.serializer(base_pattern=['A', 'B', 'C', 'A'])
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['base_pattern'], ['A', 'B', 'C', 'A'])
+
+    def test_empty_or_unknown_patterns_are_rejected(self):
+        for pattern in ([], ['A', 'D'], ['AB'], None):
+            with self.subTest(pattern=pattern):
+                serializer = self.serializer(base_pattern=pattern)
+                self.assertFalse(serializer.is_valid())
+                self.assertIn('base_pattern', serializer.errors)
+
+
+class DynamicPatternFieldTests(SimpleTestCase):
+    FIELDS = (
+        (RoomConfiguration, 'bench_pattern'),
+        (AllocationConfiguration, 'base_pattern'),
+        (DynamicAllocation, 'base_pattern'),
+    )
+
+    def test_only_bench_type_letters_are_valid(self):
+        for model, name in self.FIELDS:
+            field = model._meta.get_field(name)
+            with self.subTest(model=model.__name__):
+                self.assertEqual(field.clean('ABCAB', None), 'ABCAB')
+                for pattern in ('ABD', 'abc', 'A B', 'ABC\n'):
+                    with self.assertRaises(ValidationError):
+                        field.clean(pattern, None)
+
+    def test_blank_pattern_is_only_allowed_where_it_means_inherit(self):
+        self.assertEqual(DynamicAllocation._meta.get_field('base_pattern').clean('', None), '')
+        for model, name in self.FIELDS[:2]:
+            with self.assertRaises(ValidationError):
+                model._meta.get_field(name).clean('', None)
@@ -0,0 +1,45 @@
+import datetime
+import json
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from seating.models import Allocation, Exam, Room, SeatAssignment, Student
+from seating.serializers import AllocationSerializer, RoomSerializer, SeatAssignmentSerializer
+from seating.utils.allocation import generate_allocation
+from seating.views import AllocationRoomsView
+
+
+class AllocationRoomsViewTests(TestCase):
+
+    def setUp(self):
+        exam = Exam.objects.create(name='Midterm', date=datetime.date(2024, 1, 1))
+        self.rooms = [Room.objects.create(name=f'R{i}', rows=1, cols=2) for i in range(1, 3)]
+        for year, section in ((1, 'A'), (2, 'A')):
+            for serial in range(1, 5):
+                Student.objects.create(
+                    roll=f'{year}{section}{serial:02d}', name=f'Student {serial}', year=year, section=section,
+                )
+        self.allocation = Allocation.objects.create(exam=exam, num_rooms=len(self.rooms))
+        self.allocation.rooms.set(self.rooms)
+        generate_allocation(
+            allocation=self.allocation, student_queryset=Student.objects.all(), rooms=self.rooms,
+        )
+
+    def test_streamed_body_matches_the_serializer_response(self):
+        room = self.rooms[1]
+        request = APIRequestFactory().get('/')
+        response = AllocationRoomsView.as_view()(request, allocation_id=self.allocation.id, room_id=room.id)
+        body = json.loads(b''.join(response.streaming_content))
+
+        expected = JSONRenderer().render({
+            'allocation': AllocationSerializer(self.allocation).data,
+            'room': RoomSerializer(room).data,
+            'seat_assignments': SeatAssignmentSerializer(
+                SeatAssignment.objects.filter(allocation=self.allocation, room=room), many=True
+            ).data,
+        })
+        self.assertEqual(body, json.loads(expected))
+        self.assertEqual(len(body['allocation']['seat_assignments']), 8)
+        self.assertEqual(len(body['seat_assignments']), 4)
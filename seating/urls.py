@@ -34,5 +34,4 @@ urlpatterns = [
     path('subjects/delete/<int:subject_id>/', views.delete_subject, name='delete_subject'),
     path('subjects/by-semester/', views.get_subjects_by_semester, name='get_subjects_by_semester'),
     path('api/subjects/by-semester/', views.subjects_by_semester, name='subjects_by_semester'),
-    path('api/subjects/by-semester/', views.subjects_by_semester, name='api_subjects_by_semester'),
 ]
@@ -1,30 +1,45 @@
-﻿import math
+﻿from functools import lru_cache, partial
 import logging
 import random
 from collections import defaultdict, deque
 from typing import List, Tuple, Dict, Deque, Set
 
-# Try to use pandas if available; otherwise we'll fall back to csv
-try:
-    import pandas as pd  # type: ignore
-except ImportError:  # pragma: no cover
-    pd = None
 
 from ..models import Student, SeatAssignment
 
 logger = logging.getLogger(__name__)
 
+SEAT_INSERT_BATCH = 500
 
-def build_dynamic_pairings(available_groups: set[Tuple[int, str]], available_years: set[int]) -> List[Tuple[Tuple[int, str], Tuple[int, str]]]:
+# (id, roll, year, section) as read by group_students_by_year_section
+StudentRow = Tuple[int, str, int, str]
+
+# (rows, cols) -> [(row, col), ...] per bench index; rooms usually share a layout
+_rowcol_cache: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+
+
+def _bench_positions(rows: int, cols: int) -> List[Tuple[int, int]]:
+    """1-based (row, col) for each bench, with benches numbered column-wise."""
+    positions = _rowcol_cache.get((rows, cols))
+    if positions is None:
+        positions = [(i % rows + 1, i // rows + 1) for i in range(rows * cols)]
+        _rowcol_cache[(rows, cols)] = positions
+    return positions
+
+
+@lru_cache(maxsize=64)
+def build_dynamic_pairings(available_groups: frozenset[Tuple[int, str]], available_years: frozenset[int]) -> Tuple[Tuple[Tuple[int, str], Tuple[int, str]], ...]:
     """
     Builds dynamic pairings based on available years and sections.
+    Results are cached, so both arguments must be frozensets and the returned
+    pairings are an immutable tuple.
     - If 3 years: Use cyclic pairing (1A+2B, 2B+3A, 3A+1B, 1B+2A, 2A+3B, 3B+1A).
     - If 2 years: Pair all possible combinations of existing sections from different years.
     - If 1 year: Special handling in allocation.
     Ensures no same year on bench.
     """
     if not available_groups or not available_years:
-        return []
+        return ()
 
     sections_per_year: Dict[int, Set[str]] = defaultdict(set)
     for y, sec in available_groups:
@@ -58,7 +73,7 @@ def build_dynamic_pairings(available_groups: set[Tuple[int, str]], available_yea
         ]
 
         if pairings:
-            return pairings
+            return tuple(pairings)
 
         # Fallback for unusual section names or incomplete data.
         cycle = [(y1, y2), (y2, y3), (y3, y1)]
@@ -69,7 +84,7 @@ def build_dynamic_pairings(available_groups: set[Tuple[int, str]], available_yea
                 continue
             pairings.append(((fy1, secs1[0]), (fy2, secs2[0])))
 
-        return pairings
+        return tuple(pairings)
 
     elif num_years == 2:
         # Pair all possible combinations of existing sections from different years
@@ -80,18 +95,18 @@ def build_dynamic_pairings(available_groups: set[Tuple[int, str]], available_yea
         for sec1 in secs1:
             for sec2 in secs2:
                 pairings.append(((y1, sec1), (y2, sec2)))
-        return pairings
+        return tuple(pairings)
 
     elif num_years == 1:
         # For 1 year, handle in allocation (no pairing needed)
-        return []
+        return ()
 
     else:
         # Fallback, though unlikely
-        return []
+        return ()
 
 
-def get_next_valid_pairing(pairings: List[Tuple[Tuple[int, str], Tuple[int, str]]], student_groups: Dict[Tuple[int, str], Deque[Student]], pairing_idx: int) -> Tuple[Tuple[int, str], Tuple[int, str]]:
+def get_next_valid_pairing(pairings: List[Tuple[Tuple[int, str], Tuple[int, str]]], student_groups: Dict[Tuple[int, str], Deque[StudentRow]], pairing_idx: int) -> Tuple[Tuple[int, str], Tuple[int, str]]:
     """
     Gets the next valid pairing in the cycle where both groups have remaining students.
     Cycles through pairings until finding one with students.
@@ -113,32 +128,58 @@ def group_students_by_year_section(
     *,
     distribution_strategy: str = "cycle",
     seed: int | None = None,
-) -> Dict[Tuple[int, str], Deque[Student]]:
+) -> Dict[Tuple[int, str], List[StudentRow]]:
     """
     Groups students by (year, section) tuple.
     - cycle: keep roll-order sequence.
     - block: shuffle order within each (year, section) group.
-    Returns a dict where key is (year, section), value is deque for stateful popping.
+    Returns a dict where key is (year, section), value is the ordered list of
+    (id, roll, year, section) tuples.
     """
-    students = list(student_queryset.order_by('roll'))
-    grouped_lists: Dict[Tuple[int, str], List[Student]] = defaultdict(list)
+    # Single streamed pass of plain tuples; seating only needs the pk plus the
+    # grouping keys, so no model instances are built
+    students = (
+        student_queryset.order_by('roll')
+        .values_list('id', 'roll', 'year', 'section')
+        .iterator(chunk_size=2000)
+    )
+    grouped_lists: Dict[Tuple[int, str], List[StudentRow]] = defaultdict(list)
     for student in students:
-        key = (student.year, student.section)
-        grouped_lists[key].append(student)
+        grouped_lists[(student[2], student[3])].append(student)
 
     strategy = (distribution_strategy or "cycle").strip().lower()
     if strategy == "block":
         rng = random.Random(seed) if seed is not None else random.Random()
         for key, students_list in grouped_lists.items():
             # Block mode: randomize inside each half only.
-            half = math.ceil(len(students_list) / 2)
+            half = (len(students_list) + 1) >> 1
             first_half = students_list[:half]
             second_half = students_list[half:]
             rng.shuffle(first_half)
             rng.shuffle(second_half)
             grouped_lists[key] = first_half + second_half
 
-    return {key: deque(students_list) for key, students_list in grouped_lists.items()}
+    return dict(grouped_lists)
+
+
+def _seat_builder(allocation, room, bench_type: str, side: str):
+    """
+    SeatAssignment constructor with the per-room constants bound once. FKs
+    are set by id so no related instances are attached to each seat.
+    """
+    return partial(
+        SeatAssignment,
+        allocation_id=allocation.pk,
+        room_id=room.pk,
+        bench_type=bench_type,
+        seat_pos=side,
+        position=side,
+    )
+
+
+def _insert_seat_rows(rows: List[SeatAssignment]) -> None:
+    """Write seats with one bulk INSERT per SEAT_INSERT_BATCH rows."""
+    SeatAssignment.objects.bulk_create(rows, batch_size=SEAT_INSERT_BATCH)
 
 
 def calculate_pre_allocation_metrics(total_students: int, num_rooms: int) -> Tuple[int, int]:
@@ -147,16 +188,17 @@ def calculate_pre_allocation_metrics(total_students: int, num_rooms: int) -> Tup
     students_per_room = ceil(total_students / num_rooms)
     max_per_group_in_room = ceil(students_per_room / 2)
     """
-    students_per_room = math.ceil(total_students / num_rooms)
-    max_per_group_in_room = math.ceil(students_per_room / 2)
+    # integer ceil division; avoids float rounding for large counts
+    students_per_room = -(-total_students // num_rooms)
+    max_per_group_in_room = (students_per_room + 1) >> 1
     return students_per_room, max_per_group_in_room
 
 
 def allocate_room_seats(
     allocation,
     room,
-    group1_deque: Deque[Student],
-    group2_deque: Deque[Student],
+    group1_deque: Deque[StudentRow],
+    group2_deque: Deque[StudentRow],
     bench_type: str,
     max_per_group_in_room: int,
     group1_room_limit: int | None = None,
@@ -173,58 +215,45 @@ def allocate_room_seats(
     FIX: Only create SeatAssignment rows for actual students (student != None).
     Empty seats are derived in UI, not stored in DB.
     """
-    assignments = []
     rows = room.rows
     cols = room.cols
     total_benches = rows * cols
 
-    group1_count = 0
-    group2_count = 0
     # If a per-group room limit is provided (half-split logic), do NOT cap it
     # by the global max_per_group_in_room, otherwise we under-allocate.
     group1_room_limit = max_per_group_in_room if group1_room_limit is None else min(group1_room_limit, len(group1_deque))
     group2_room_limit = max_per_group_in_room if group2_room_limit is None else min(group2_room_limit, len(group2_deque))
 
-    for bench_no in range(1, total_benches + 1):
-        # Stop if both groups have reached room limits
-        if group1_count >= group1_room_limit and group2_count >= group2_room_limit:
-            break
-
-        # Calculate row and column: benches numbered column-wise
-        col = ((bench_no - 1) // rows) + 1
-        row = ((bench_no - 1) % rows) + 1
-
-        # Left seat: pop from group1 if available and not at limit, create assignment only if student exists
-        if group1_deque and group1_count < group1_room_limit:
-            left_student = group1_deque.popleft()
-            assignments.append(SeatAssignment(
-                allocation=allocation,
-                room=room,
-                bench_no=bench_no,
-                seat_pos='left',
-                bench_type=bench_type,
-                student=left_student,
-                row=row,
-                column=col,
-                position='left'
-            ))
-            group1_count += 1
-
-        # Right seat: pop from group2 if available and not at limit, create assignment only if student exists
-        if group2_deque and group2_count < group2_room_limit:
-            right_student = group2_deque.popleft()
-            assignments.append(SeatAssignment(
-                allocation=allocation,
-                room=room,
-                bench_no=bench_no,
-                seat_pos='right',
-                bench_type=bench_type,
-                student=right_student,
-                row=row,
-                column=col,
-                position='right'
-            ))
-            group2_count += 1
+    # Seat counts are known up front: group1 fills left seats of benches 1..n,
+    # group2 fills right seats of benches 1..m. Pop both groups in one go and
+    # build the assignments from those flat lists.
+    group1_count = min(len(group1_deque), group1_room_limit, total_benches)
+    group2_count = min(len(group2_deque), group2_room_limit, total_benches)
+    left_students = [group1_deque.popleft() for _ in range(group1_count)]
+    right_students = [group2_deque.popleft() for _ in range(group2_count)]
+
+    positions = _bench_positions(rows, cols)
+    make_left = _seat_builder(allocation, room, bench_type, 'left')
+    make_right = _seat_builder(allocation, room, bench_type, 'right')
+    assignments = []
+    append = assignments.append
+
+    # Benches where both seats are filled: no per-seat checks needed
+    paired = min(group1_count, group2_count)
+    for i in range(paired):
+        bench_no = i + 1
+        row, col = positions[i]
+        append(make_left(bench_no=bench_no, student_id=left_students[i][0], row=row, column=col))
+        append(make_right(bench_no=bench_no, student_id=right_students[i][0], row=row, column=col))
+
+    # Tail: only the larger group still has students
+    if group1_count > paired:
+        make_tail, tail_students = make_left, left_students
+    else:
+        make_tail, tail_students = make_right, right_students
+    for i in range(paired, max(group1_count, group2_count)):
+        row, col = positions[i]
+        append(make_tail(bench_no=i + 1, student_id=tail_students[i][0], row=row, column=col))
 
     return assignments, group1_count, group2_count
 
@@ -232,7 +261,7 @@ def allocate_room_seats(
 def allocate_room_seats_single_year(
     allocation,
     room,
-    year_deque: Deque[Student],
+    year_deque: Deque[StudentRow],
     bench_type: str,
     room_limit: int | None = None,
 ) -> Tuple[List[SeatAssignment], int]:
@@ -243,38 +272,21 @@ def allocate_room_seats_single_year(
     FIX: Only create SeatAssignment rows for actual students (student != None).
     Empty seats are derived in UI, not stored in DB.
     """
-    assignments = []
     rows = room.rows
     cols = room.cols
     total_benches = rows * cols
 
-    used = 0
-    for bench_no in range(1, total_benches + 1):
-        if not year_deque:
-            break
-        if room_limit is not None and used >= room_limit:
-            break
+    used = min(len(year_deque), total_benches)
+    if room_limit is not None:
+        used = max(0, min(used, room_limit))
+    students = [year_deque.popleft() for _ in range(used)]
 
-        # Calculate row and column: benches numbered column-wise
-        col = ((bench_no - 1) // rows) + 1
-        row = ((bench_no - 1) % rows) + 1
-
-        # Left seat: pop from year_deque, create assignment only if student exists
-        left_student = year_deque.popleft()
-        assignments.append(SeatAssignment(
-            allocation=allocation,
-            room=room,
-            bench_no=bench_no,
-            seat_pos='left',
-            bench_type=bench_type,
-            student=left_student,
-            row=row,
-            column=col,
-            position='left'
-        ))
-        used += 1
-
-        # Right seat: empty - DO NOT create SeatAssignment row for empty seats
+    # Left seat only; the right seat stays empty and gets no SeatAssignment row
+    make_left = _seat_builder(allocation, room, bench_type, 'left')
+    assignments = [
+        make_left(bench_no=i + 1, student_id=student[0], row=row, column=col)
+        for i, (student, (row, col)) in enumerate(zip(students, _bench_positions(rows, cols)))
+    ]
 
     return assignments, used
 
@@ -321,7 +333,9 @@ def generate_allocation(
     """
     logger.info("Starting fully dynamic allocation logic")
 
-    # Delete old assignments
+    # Delete old assignments. Nothing references SeatAssignment and it has no
+    # delete signal receivers, so Django fast-deletes this as a single DELETE
+    # without loading rows; keep it that way.
     SeatAssignment.objects.filter(allocation=allocation).delete()
 
     total_students = student_queryset.count()
@@ -333,9 +347,12 @@ def generate_allocation(
 
     # Calculate pre-allocation metrics
     students_per_room, max_per_group_in_room = calculate_pre_allocation_metrics(total_students, num_rooms)
-    logger.info(f"Pre-allocation metrics: students_per_room={students_per_room}, max_per_group_in_room={max_per_group_in_room}")
+    logger.info(
+        "Pre-allocation metrics: students_per_room=%s, max_per_group_in_room=%s",
+        students_per_room, max_per_group_in_room,
+    )
 
-    # Group students into deques: stateful allocation
+    # Group students into ordered lists; halves below become deques for stateful popping
     student_groups = group_students_by_year_section(
         student_queryset,
         distribution_strategy=distribution_strategy,
@@ -343,10 +360,9 @@ def generate_allocation(
     )
     # Split each (year, section) into first/second halves so paired groups can
     # use complementary halves in the same room.
-    group_half_queues: Dict[Tuple[int, str], Dict[str, Deque[Student]]] = {}
-    for key, dq in student_groups.items():
-        students_list = list(dq)
-        half = math.ceil(len(students_list) / 2)
+    group_half_queues: Dict[Tuple[int, str], Dict[str, Deque[StudentRow]]] = {}
+    for key, students_list in student_groups.items():
+        half = (len(students_list) + 1) >> 1
         group_half_queues[key] = {
             "first": deque(students_list[:half]),
             "second": deque(students_list[half:]),
@@ -357,11 +373,16 @@ def generate_allocation(
         key: "first" for key in group_half_queues.keys()
     }
 
+    # Running counts of unseated students, updated as rooms are filled
+    left_per_group: Dict[Tuple[int, str], int] = {
+        key: len(students_list) for key, students_list in student_groups.items()
+    }
+    total_left = sum(left_per_group.values())
+
     def remaining_count(group_key: Tuple[int, str]) -> int:
-        halves = group_half_queues.get(group_key, {})
-        return len(halves.get("first", deque())) + len(halves.get("second", deque()))
+        return left_per_group.get(group_key, 0)
 
-    def pick_half_queue(group_key: Tuple[int, str], preferred_half: str) -> Tuple[Deque[Student], str | None]:
+    def pick_half_queue(group_key: Tuple[int, str], preferred_half: str) -> Tuple[Deque[StudentRow], str | None]:
         halves = group_half_queues.get(group_key, {})
         primary = halves.get(preferred_half)
         secondary_key = "second" if preferred_half == "first" else "first"
@@ -375,26 +396,40 @@ def generate_allocation(
     # Bench types cycle: A, B, C, repeat
     bench_types = ['A', 'B', 'C']
 
-    seating_assignments = []
+    # Assignments are written every SEAT_INSERT_BATCH rows instead of being
+    # collected for the whole allocation
+    pending_assignments: List[SeatAssignment] = []
+    saved_count = 0
     pairing_idx = 0  # Tracks current position in pairing cycle
     group_idx = 0  # Tracks current position for single-year group rotation
     rooms_processed = 0
 
+    available_groups = None
     for room_idx, room in enumerate(rooms):
         # CRITICAL: Check if any students remain before allocating this room
-        total_remaining = sum(remaining_count(k) for k in group_half_queues.keys())
-        if total_remaining == 0:
-            logger.info(f"No students remaining; stopping allocation after {rooms_processed} rooms")
+        if total_left == 0:
+            logger.info("No students remaining; stopping allocation after %s rooms", rooms_processed)
             break
 
-        # Recompute available groups/years dynamically based on remaining students
-        available_groups = set(k for k in group_half_queues.keys() if remaining_count(k) > 0)
-        available_years = set(year for year, _ in available_groups)
-        logger.info(f"Available groups (remaining): {sorted(available_groups)}, Available years: {sorted(available_years)}")
-
-        # Build dynamic pairings based on remaining years/groups
-        pairings = build_dynamic_pairings(available_groups, available_years)
-        logger.info(f"Dynamic pairings built (remaining): {pairings}")
+        # Available groups/years only change when a group runs out, so pairings
+        # are rebuilt (and logged) only then.
+        current_groups = frozenset(k for k, count in left_per_group.items() if count > 0)
+        if current_groups != available_groups:
+            available_groups = current_groups
+            available_years = frozenset(year for year, _ in available_groups)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Available groups (remaining): %s, Available years: %s",
+                    sorted(available_groups), sorted(available_years),
+                )
+
+            # Build dynamic pairings based on remaining years/groups
+            pairings = build_dynamic_pairings(available_groups, available_years)
+            logger.info("Dynamic pairings built (remaining): %s", pairings)
+            # Front of the deque is the next pairing to try
+            pairings = deque(pairings)
+            if pairings:
+                pairings.rotate(-(pairing_idx % len(pairings)))
 
         bench_type = bench_types[room_idx % len(bench_types)]
         room_assignments = []
@@ -434,30 +469,36 @@ def generate_allocation(
                 bench_type=bench_type,
                 room_limit=room_limit,
             )
+            left_per_group[selected_group] -= used
+            total_left -= used
             if used_half:
                 next_half_for_group[selected_group] = "second" if used_half == "first" else "first"
         else:
             # Multi-year: use pairings
-            selected_pair_idx = None
             group1_key = None
             group2_key = None
-            for i in range(len(pairings)):
-                idx = (pairing_idx + i) % len(pairings)
-                candidate_g1, candidate_g2 = pairings[idx]
+            # A full unsuccessful pass rotates the deque back to where it started
+            for step in range(len(pairings)):
+                candidate_g1, candidate_g2 = pairings[0]
+                pairings.rotate(-1)
                 if remaining_count(candidate_g1) > 0 and remaining_count(candidate_g2) > 0:
-                    selected_pair_idx = idx
                     group1_key, group2_key = candidate_g1, candidate_g2
+                    # reduced modulo the current list so a rebuilt list
+                    # resumes at the same index as before
+                    pairing_idx = (pairing_idx + step + 1) % len(pairings)
                     break
-            if selected_pair_idx is None or group1_key is None or group2_key is None:
+            if group1_key is None or group2_key is None:
                 continue
-            pairing_idx = (selected_pair_idx + 1) % len(pairings) if pairings else 0
 
             g1_pref = next_half_for_group.get(group1_key, "first")
             g2_pref = "second" if g1_pref == "first" else "first"
             group1_deque, g1_half = pick_half_queue(group1_key, g1_pref)
             group2_deque, g2_half = pick_half_queue(group2_key, g2_pref)
 
-            logger.info(f"Room {room.name}: Pairing {group1_key} + {group2_key}, Bench type {bench_type}, Group1 remaining: {len(group1_deque)}, Group2 remaining: {len(group2_deque)}")
+            logger.info(
+                "Room %s: Pairing %s + %s, Bench type %s, Group1 remaining: %s, Group2 remaining: %s",
+                room.name, group1_key, group2_key, bench_type, len(group1_deque), len(group2_deque)
+            )
 
             room_assignments, group1_used, group2_used = allocate_room_seats(
                 allocation=allocation,
@@ -469,6 +510,9 @@ def generate_allocation(
                 group1_room_limit=len(group1_deque),
                 group2_room_limit=len(group2_deque),
             )
+            left_per_group[group1_key] -= group1_used
+            left_per_group[group2_key] -= group2_used
+            total_left -= group1_used + group2_used
 
             if g1_half:
                 next_half_for_group[group1_key] = "second" if g1_half == "first" else "first"
@@ -477,17 +521,20 @@ def generate_allocation(
 
         # Only count this room if it has assignments
         if room_assignments:
-            seating_assignments.extend(room_assignments)
+            pending_assignments.extend(room_assignments)
+            saved_count += len(room_assignments)
             rooms_processed += 1
+            if len(pending_assignments) >= SEAT_INSERT_BATCH:
+                _insert_seat_rows(pending_assignments)
+                pending_assignments = []
         else:
-            logger.info(f"Room {room.name}: No assignments made, skipping")
+            logger.info("Room %s: No assignments made, skipping", room.name)
 
-    # Bulk create assignments
-    if seating_assignments:
-        SeatAssignment.objects.bulk_create(seating_assignments)
+    # Bulk create remaining assignments
+    if pending_assignments:
+        _insert_seat_rows(pending_assignments)
 
-    saved_count = len(seating_assignments)
-    logger.info(f"Allocated {saved_count} seats across {rooms_processed} rooms")
+    logger.info("Allocated %s seats across %s rooms", saved_count, rooms_processed)
 
     return {"total_seats": saved_count, "rooms_processed": rooms_processed}
 
@@ -509,96 +556,3 @@ def group_students_by_year(students):
             year_groups[int(year)].append(student)
     return dict(year_groups)
 
-
-def parse_excel_or_csv_file(file_obj):
-    """
-    Parse Excel or CSV file containing student data.
-    Uses pandas if available, falls back to Python's csv module.
-
-    The underlying row parsing logic is delegated to parse_student_row,
-    which must return either:
-        {"error": "message", "row": original_row_dict}
-    or a valid student dict:
-        {"roll": ..., "name": ..., "year": ..., "department": ..., "extra": ..., ...}
-
-    Returns:
-        (students_data, invalid_rows)
-        students_data: list of valid parsed student dicts
-        invalid_rows: list of {"row_number", "error", "row_data"}
-    """
-    # ---------------- Read file into a tabular `rows` list ----------------
-    if pd is not None:
-        from io import BytesIO, StringIO
-
-        if hasattr(file_obj, "read"):
-            # File-like object from Django upload
-            content = file_obj.read()
-            # Excel or CSV?
-            if isinstance(content, bytes):
-                # Try Excel first
-                try:
-                    df = pd.read_excel(BytesIO(content))
-                except Exception:
-                    # Not a valid Excel, try CSV
-                    df = pd.read_csv(BytesIO(content))
-            else:
-                # Content is text -> CSV
-                df = pd.read_csv(StringIO(content))
-        else:
-            # file_obj is a filesystem path
-            file_str = str(file_obj)
-            if file_str.lower().endswith(".csv"):
-                df = pd.read_csv(file_str)
-            else:
-                df = pd.read_excel(file_str)
-
-        rows_iterable = df.to_dict(orient="records")
-    else:
-        # No pandas: fall back to csv only
-        import csv
-        from io import StringIO
-
-        if hasattr(file_obj, "read"):
-            content = file_obj.read()
-            if isinstance(content, bytes):
-                content = content.decode("utf-8", errors="ignore")
-        else:
-            with open(file_obj, "r", encoding="utf-8") as f:
-                content = f.read()
-
-        reader = csv.DictReader(StringIO(content))
-        rows_iterable = list(reader)
-
-    # ---------------- Parse rows using custom parser ----------------
-    from .parsers import parse_student_row
-
-    students_data: list[dict] = []
-    invalid_rows: list[dict] = []
-
-    for idx, row in enumerate(rows_iterable):
-        parsed = parse_student_row(row)
-        if "error" in parsed:
-            invalid_rows.append(
-                {
-                    "row_number": idx + 2,  # +2: human row (1-based) + header row
-                    "error": parsed["error"],
-                    "row_data": parsed["row"],
-                }
-            )
-        else:
-            students_data.append(parsed)
-
-    logger.info(
-        "Parsed student file: %d valid rows, %d invalid rows",
-        len(students_data),
-        len(invalid_rows),
-    )
-
-    return students_data, invalid_rows
-
-
-
-
-
-
-
@@ -0,0 +1,100 @@
+import contextlib
+import logging
+import random
+import time
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+# Settings for bulk imports on SQLite: a 512 MB page cache, no automatic WAL
+# checkpoints while writing and NORMAL fsync behaviour.
+IMPORTER_PRAGMAS = {
+    'cache_size': -524288,
+    'wal_autocheckpoint': 0,
+    'synchronous': 'NORMAL',
+}
+
+# Applied to every new SQLite connection: WAL lets readers and the writer
+# proceed together, and busy_timeout makes SQLite wait for the write lock
+# inside its own busy handler instead of raising "database is locked".
+SQLITE_CONNECTION_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'busy_timeout': 5000,
+    'synchronous': 'NORMAL',
+}
+
+
+def _apply_pragmas(cursor, pragmas):
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+
+
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """connection_created receiver that applies SQLITE_CONNECTION_PRAGMAS."""
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            _apply_pragmas(cursor, SQLITE_CONNECTION_PRAGMAS)
+
+
+@contextlib.contextmanager
+def importer_pragmas(using=DEFAULT_DB_ALIAS):
+    """
+    Apply IMPORTER_PRAGMAS for the duration of a bulk import.
+
+    Previous values are restored on exit, then the WAL is checkpointed and
+    PRAGMA optimize is run. Connections opened while the block is active get
+    the same settings. Does nothing on non-SQLite backends.
+    """
+    conn = connections[using]
+    if conn.vendor != 'sqlite':
+        yield
+        return
+
+    with conn.cursor() as cursor:
+        previous = {}
+        for name in IMPORTER_PRAGMAS:
+            cursor.execute(f"PRAGMA {name}")
+            previous[name] = cursor.fetchone()[0]
+        _apply_pragmas(cursor, IMPORTER_PRAGMAS)
+
+    def reapply(sender, connection, **kwargs):
+        if connection.alias == using:
+            with connection.cursor() as cursor:
+                _apply_pragmas(cursor, IMPORTER_PRAGMAS)
+
+    connection_created.connect(reapply, weak=False)
+    try:
+        yield
+    finally:
+        connection_created.disconnect(reapply)
+        with conn.cursor() as cursor:
+            _apply_pragmas(cursor, previous)
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            cursor.execute("PRAGMA optimize")
+        logger.info("Restored SQLite pragmas after import: %s", previous)
+
+
+def retry_on_locked(fn, max_attempts=2, base=0.01, cap=1.0):
+    """
+    Call fn() and retry it while SQLite reports "database is locked".
+
+    Lock waits are normally absorbed by busy_timeout (see
+    SQLITE_CONNECTION_PRAGMAS); SQLite still fails fast when a deferred
+    transaction cannot upgrade from read to write, which is what the single
+    default retry is for. Waits grow exponentially from base up to cap
+    seconds and are jittered by +/-50%. fn should wrap its own
+    transaction.atomic() so each attempt starts from a clean state. The last
+    error is re-raised once max_attempts is reached.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except DatabaseError as exc:
+            if 'locked' not in str(exc).lower() or attempt == max_attempts - 1:
+                raise
+            delay = min(cap, base * 2 ** attempt) * random.uniform(0.5, 1.5)
+            logger.warning("Database locked, retrying in %.3fs (attempt %d/%d)",
+                           delay, attempt + 1, max_attempts)
+            time.sleep(delay)
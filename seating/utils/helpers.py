@@ -1,7 +1,7 @@
 from django.db.models import QuerySet
 from django.core.exceptions import ObjectDoesNotExist
 from ..models import Room
-from collections import defaultdict
+from collections import defaultdict, deque
 
 
 def bench_to_row_col(bench, cols):
@@ -29,15 +29,16 @@ def ensure_room_qs(rooms, RoomModel=Room):
         return RoomModel.objects.filter(pk=rooms.pk)
     if isinstance(rooms, int):
         return RoomModel.objects.filter(pk=rooms)
-    # list/tuple of ints or Room objects
+    # list/tuple of ints or Room objects; lists are assumed homogeneous, so
+    # the first element decides how the whole list is read
     if isinstance(rooms, (list, tuple, set)):
-        # if list of ints
-        if all(isinstance(x, int) for x in rooms):
+        first = next(iter(rooms), None)
+        if first is None:
+            return RoomModel.objects.none()
+        if isinstance(first, int):
             return RoomModel.objects.filter(pk__in=list(rooms))
-        # if list of Room instances
-        if all(hasattr(x, 'pk') for x in rooms):
-            pks = [x.pk for x in rooms]
-            return RoomModel.objects.filter(pk__in=pks)
+        if hasattr(first, 'pk'):
+            return RoomModel.objects.filter(pk__in=[x.pk for x in rooms])
     raise ValueError("Invalid rooms parameter; expected queryset, model instance, id or list")
 
 
@@ -49,9 +50,9 @@ def group_students_by_year(students):
         students: List of Student objects
 
     Returns:
-        Dict {"1": [...], "2": [...], "3": [...]}
+        Dict {"1": deque([...]), "2": deque([...]), "3": deque([...])}
     """
-    students_by_year = defaultdict(list)
+    students_by_year = defaultdict(deque)
     for student in students:
         if student.year is not None:
             year = str(student.year)
@@ -75,14 +76,14 @@ def cycle_bench_patterns():
 
 def safe_pop(year_list):
     """
-    Safely pop the first student from a year list.
+    Safely pop the first student from a year queue.
 
     Args:
-        year_list: List of Student objects for a year
+        year_list: deque of Student objects for a year
 
     Returns:
-        Student object or None if list is empty
+        Student object or None if the queue is empty
     """
     if year_list:
-        return year_list.pop(0)
+        return year_list.popleft()
     return None
@@ -1,10 +1,16 @@
 # seating/utils/parsers.py
 import re
+import time
 import logging
-from typing import Any, Dict, List, Iterable, Tuple, Optional
+from itertools import islice
+from typing import Any, Dict, List, Iterator, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
 # Import BatchMapping only here (models)
 from ..models import BatchMapping
 
@@ -14,9 +20,27 @@ try:
 except Exception:
     pd = None
 
+try:
+    from openpyxl import load_workbook  # type: ignore
+except Exception:
+    load_workbook = None
+
+# Rows per DataFrame when reading CSV and .xlsx uploads
+CSV_CHUNK_ROWS = 50_000
+
 
 # -------------------- helpers --------------------
 
+# Leading bytes of .xlsx (zip container) and legacy .xls (OLE2) files
+_XLSX_MAGIC = b'PK\x03\x04'
+_XLS_MAGIC = b'\xd0\xcf\x11\xe0'
+
+
+def is_excel_content(content: bytes) -> bool:
+    """True if content starts with an .xlsx or .xls signature."""
+    return content[:4] == _XLSX_MAGIC or content[:4] == _XLS_MAGIC
+
+
 def roman_to_int(roman: Optional[Any]) -> Optional[int]:
     if roman is None:
         return None
@@ -25,69 +49,154 @@ def roman_to_int(roman: Optional[Any]) -> Optional[int]:
     return mapping.get(r)
 
 
+# Roll number shapes, tried in this order; the group suffix tells which matched:
+#   1: 3 digits (batch) + 2–4 letters (dept) + 3–4 digits (serial)
+#   2: 3 letters (dept) + 2–4 alnum (batch) + 3–4 digits (serial)
+#   3: YYUG<DEPT><SERIAL> e.g., 24UGBCA00003
+# Every run is bounded and the pattern is anchored, so backtracking is
+# limited to a few steps per roll without possessive quantifiers (which
+# would need Python 3.11+).
+_ROLL_ALL = re.compile(
+    r'^(?:'
+    r'(?P<b1>\d{3})(?P<d1>[A-Za-z]{2,4})(?P<s1>\d{3,4})'
+    r'|(?P<d2>[A-Za-z]{3})(?P<b2>[A-Za-z0-9]{2,4})(?P<s2>\d{3,4})'
+    r'|(?P<b3>\d{2})UG(?P<d3>[A-Z]{2,4})(?P<s3>\d{3,5})'
+    r')$'
+)
+
+
+# ASCII character classes for _split_roll: 0 = digit, 1 = letter, 2 = other
+_DIGIT, _ALPHA, _OTHER = 0, 1, 2
+_CLS = bytes(
+    _DIGIT if 48 <= c <= 57 else _ALPHA if (65 <= c <= 90 or 97 <= c <= 122) else _OTHER
+    for c in range(256)
+)
+
+
+def _split_roll_regex(roll: str) -> Optional[Tuple[str, str, str]]:
+    m = _ROLL_ALL.match(roll)
+    if not m:
+        return None
+    gd = m.groupdict()
+    if gd['b1'] is not None:
+        return gd['b1'], gd['d1'], gd['s1']
+    if gd['b2'] is not None:
+        return gd['b2'], gd['d2'], gd['s2']
+    return gd['b3'], gd['d3'], gd['s3']
+
+
+def _split_roll(roll: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split roll into (batch_code, dept_code, serial) with a single scan, or
+    None if it matches none of the _ROLL_ALL shapes. Non-ASCII input goes
+    through the regex so Unicode digits behave exactly as before.
+    """
+    try:
+        b = roll.encode('ascii')
+    except UnicodeEncodeError:
+        return _split_roll_regex(roll)
+    n = len(b)
+
+    if b[:3].isdigit():
+        # Pattern 1: 3 digits + 2–4 letters + 3–4 digits
+        i = 3
+        while i < n and _CLS[b[i]] == _ALPHA:
+            i += 1
+        if 2 <= i - 3 <= 4 and 3 <= n - i <= 4 and b[i:].isdigit():
+            return roll[:3], roll[3:i], roll[i:]
+        return None
+
+    if b[:2].isdigit() and b[2:4] == b'UG':
+        # Pattern 3: YY + UG + 2–4 upper-case letters + 3–5 digits
+        i = 4
+        while i < n and _CLS[b[i]] == _ALPHA:
+            i += 1
+        if 2 <= i - 4 <= 4 and b[4:i].isupper() and 3 <= n - i <= 5 and b[i:].isdigit():
+            return roll[:2], roll[4:i], roll[i:]
+        return None
+
+    if b[:3].isalpha() and b[3:].isalnum():
+        # Pattern 2: 3 letters + 2–4 alnum (batch) + 3–4 digits; the batch
+        # takes as many characters as it can, like the greedy regex
+        tail = n - 3
+        for k in (4, 3, 2):
+            if 3 <= tail - k <= 4 and b[3 + k:].isdigit():
+                return roll[3:3 + k], roll[:3], roll[3 + k:]
+    return None
+
+
 def parse_roll_number(roll: Any) -> Optional[Dict[str, Any]]:
     roll = str(roll).strip()
-    # Pattern 1: 3 digits (batch) + 2–4 letters (dept) + 3–4 digits (serial)
-    pattern1 = r'^(\d{3})([A-Za-z]{2,4})(\d{3,4})$'
-    m1 = re.match(pattern1, roll)
-    if m1:
-        batch_code, dept_code, serial_str = m1.groups()
-        try:
-            serial = int(serial_str)
-            return {'batch_code': batch_code, 'dept_code': dept_code.lower(), 'serial': serial}
-        except ValueError:
-            return None
-
-    # Pattern 2: 3 letters (dept) + 2–4 alnum (batch) + 3–4 digits (serial)
-    pattern2 = r'^([A-Za-z]{3})([A-Za-z0-9]{2,4})(\d{3,4})$'
-    m2 = re.match(pattern2, roll)
-    if m2:
-        dept_code, batch_code, serial_str = m2.groups()
-        try:
-            serial = int(serial_str)
-            return {'batch_code': batch_code, 'dept_code': dept_code.lower(), 'serial': serial}
-        except ValueError:
-            return None
-
-    # Pattern 3: YYUG<DEPT><SERIAL> e.g., 24UGBCA00003
-    pattern3 = r'^(\d{2})UG([A-Z]{2,4})(\d{3,5})$'
-    m3 = re.match(pattern3, roll)
-    if m3:
-        batch_code, dept_code, serial_str = m3.groups()
-        try:
-            serial = int(serial_str)
-            return {'batch_code': batch_code, 'dept_code': dept_code.lower(), 'serial': serial}
-        except ValueError:
-            return None
+    parts = _split_roll(roll)
+    if parts is None:
+        return None
 
-    return None
+    batch_code, dept_code, serial_str = parts
+    try:
+        serial = int(serial_str)
+    except ValueError:
+        return None
+    return {'batch_code': batch_code, 'dept_code': dept_code.lower(), 'serial': serial}
+
+
+def load_batch_map() -> Dict[str, int]:
+    """Load every BatchMapping as {batch_code: year} with a single query."""
+    return dict(BatchMapping.objects.values_list('batch_code', 'year'))
+
+
+# {batch_code: year} for batch_to_year calls made without a batch_map, kept
+# in Django's cache under a version bumped whenever a BatchMapping changes.
+# As with the dynamic configuration cache (models_dynamic), the timeout bounds
+# staleness on per-process backends and for writes that skip the signals.
+BATCH_MAP_CACHE_TIMEOUT = 60
+_BATCH_MAP_VERSION_KEY = 'seating:batch_map:version'
+
+
+def _cached_batch_map() -> Dict[str, int]:
+    # seeded from the clock so a version evicted from the cache is not reused
+    version = cache.get_or_set(_BATCH_MAP_VERSION_KEY, time.time_ns, timeout=None)
+    key = f'seating:batch_map:{version}'
+    batch_map = cache.get(key)
+    if batch_map is None:
+        batch_map = load_batch_map()
+        cache.set(key, batch_map, BATCH_MAP_CACHE_TIMEOUT)
+    return batch_map
+
+
+@receiver(post_save, sender=BatchMapping)
+@receiver(post_delete, sender=BatchMapping)
+def _clear_batch_map_cache(sender, **kwargs):
+    try:
+        cache.incr(_BATCH_MAP_VERSION_KEY)
+    except ValueError:
+        cache.set(_BATCH_MAP_VERSION_KEY, time.time_ns(), timeout=None)
 
 
-def batch_to_year(batch_code: Optional[str]) -> int:
-    """Try DB mapping, else fall back to sensible default (1)."""
+def batch_to_year(batch_code: Optional[str], batch_map: Optional[Dict[str, int]] = None) -> int:
+    """
+    Try DB mapping, else fall back to sensible default (1).
+    When batch_map (see load_batch_map) is given it is used as is; otherwise
+    the cached mapping from _cached_batch_map is used.
+    """
     if not batch_code:
         return 1
-    try:
-        mapping = BatchMapping.objects.get(batch_code=batch_code)
-        return mapping.year
-    except Exception:
-        # fallback: if numeric, you might implement logic; default to 1
+    if batch_map is None:
         try:
-            if str(batch_code).isdigit():
-                # Example quick heuristic (customise to your college rules):
-                # You could map 231->1, 221->2, etc. But we return 1 as safe default.
-                return 1
+            batch_map = _cached_batch_map()
         except Exception:
-            pass
-    return 1
+            logger.exception("Could not load BatchMapping; defaulting year to 1")
+            return 1
+    # Unmapped codes default to 1. A numeric heuristic (e.g. 231->1, 221->2)
+    # could go here; customise to your college rules.
+    return batch_map.get(batch_code, 1)
 
 
 # -------------------- row parsing --------------------
 
-def parse_student_row(row: Dict[str, Any]) -> Dict[str, Any]:
+def parse_student_row(row: Dict[str, Any], batch_map: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
     """
     Parse a single row (dict / pandas Series) and return either parsed dict
-    or {'error': '...', 'row': row}
+    or {'error': '...', 'row': row}. batch_map is passed on to batch_to_year.
     """
     def get_val(row_obj, keys):
         for k in keys:
@@ -135,7 +244,7 @@ def parse_student_row(row: Dict[str, Any]) -> Dict[str, Any]:
             except Exception:
                 return {'error': f'Invalid year value: {year_raw} (expected I/II/III or 1/2/3)', 'row': row}
     else:
-        year = batch_to_year(parsed_roll['batch_code'])
+        year = batch_to_year(parsed_roll['batch_code'], batch_map)
 
     return {
         'roll': roll,
@@ -150,80 +259,291 @@ def parse_student_row(row: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-# -------------------- file parsing --------------------
+# -------------------- dataframe parsing --------------------
 
-def parse_excel_or_csv_file(file_obj) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+# Column aliases, in the same priority order parse_student_row uses
+_ROLL_COLS = ('roll', 'Roll', 'Roll Number', 'Roll No', 'ROLL', 'ROLL NO')
+_NAME_COLS = ('name', 'Name', 'Student Name')
+_DEPT_COLS = ('department', 'Department', 'Dept', 'Dept Code')
+_SECTION_COLS = ('section', 'Section', 'SECTION', 'Sec')
+_YEAR_COLS = ('year', 'Year', 'YEAR')
+_EXTRA_COLS = ('extra', 'Extra', 'Remarks')
+
+# Year values the vectorised path accepts; anything else goes through
+# parse_student_row so error messages stay identical
+_FAST_YEAR_VALUES = {'I': 1, 'II': 2, 'III': 3, '1': 1, '2': 2, '3': 3}
+
+
+def _df_column(df, aliases):
     """
-    Read uploaded file_obj (Django InMemoryUploadedFile or file-like),
-    return (students_data, invalid_rows).
+    Stripped string values of the first non-empty alias column per row,
+    '' where none is set. Empty cells (None after parse_student_dataframe's
+    normalisation, or NaN) count as missing.
+    """
+    result = None
+    for alias in aliases:
+        if alias not in df.columns:
+            continue
+        col = df[alias]
+        col = col.where(col.notna(), '').astype(str).str.strip()
+        result = col if result is None else result.where(result != '', col)
+    if result is None:
+        return pd.Series('', index=df.index, dtype=object)
+    return result
+
+
+def parse_student_dataframe(df, batch_map: Optional[Dict[str, int]] = None, row_offset: int = 0) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
-    rows_iterable: List[Dict[str, Any]] = []
+    Column-wise counterpart of parse_student_row for a whole DataFrame.
 
-    # If pandas available, prefer it for robustness
-    if pd is not None:
-        from io import BytesIO, StringIO
+    Roll patterns, required fields and year values are checked with pandas
+    masks and valid rows are built straight from the columns. Rows failing
+    any mask are handed to parse_student_row, so malformed input produces
+    the same errors as before. Returns (students_data, invalid_rows) in file order.
+    row_offset is the number of data rows before df when reading in chunks.
+    """
+    if batch_map is None:
+        batch_map = load_batch_map()
+
+    # Empty cells become None once, up front, so the masks below and the
+    # parse_student_row fallback see identical values (not NaN / 'nan')
+    df = df.reset_index(drop=True)
+    df = df.astype(object).where(df.notna(), None)
+    roll = _df_column(df, _ROLL_COLS)
+    name = _df_column(df, _NAME_COLS)
+    year_key = _df_column(df, _YEAR_COLS).str.upper()
+
+    # One pass of the fused pattern; at most one alternative's groups are set.
+    # combine_first keeps the object dtype even when no roll matched, where
+    # fillna would downcast an all-NaN column to float and break .str
+    ext = roll.str.extract(_ROLL_ALL.pattern)
+    batch = ext['b1'].combine_first(ext['b2']).combine_first(ext['b3'])
+    dept_code = ext['d1'].combine_first(ext['d2']).combine_first(ext['d3']).str.lower()
+    serial = ext['s1'].combine_first(ext['s2']).combine_first(ext['s3'])
+    matched = serial.notna()
+
+    has_year = year_key != ''
+    explicit_year = year_key.map(_FAST_YEAR_VALUES)
+    ok = (roll != '') & (name != '') & matched & (~has_year | explicit_year.notna())
+
+    year = explicit_year.where(has_year, batch.map(batch_map)).fillna(1)
+
+    fast = df.index[ok]
+    department = _df_column(df, _DEPT_COLS)
+    section = _df_column(df, _SECTION_COLS).str.upper()
+    extra = _df_column(df, _EXTRA_COLS)
+
+    parsed_by_pos: Dict[int, Dict[str, Any]] = {}
+    for pos, r, n, bc, dc, sr, y, dep, sec, ex in zip(
+        fast.tolist(),
+        roll[fast].tolist(),
+        name[fast].tolist(),
+        batch[fast].tolist(),
+        dept_code[fast].tolist(),
+        serial[fast].tolist(),
+        year[fast].tolist(),
+        department[fast].tolist(),
+        section[fast].tolist(),
+        extra[fast].tolist(),
+    ):
+        parsed_by_pos[pos] = {
+            'roll': r,
+            'name': n,
+            'batch_code': bc,
+            'dept_code': dc,
+            'serial': int(sr),
+            'year': int(y),
+            'department': dep or None,
+            'section': sec or None,
+            'extra': ex or None,
+        }
+
+    # per-row fallback for anything the masks rejected
+    invalid_rows: List[Dict[str, Any]] = []
+    slow = df.index[~ok]
+    for pos, row in zip(slow.tolist(), df.loc[slow].to_dict('records')):
+        row_number = row_offset + pos + 2
+        try:
+            parsed = parse_student_row(row, batch_map)
+            if "error" in parsed:
+                invalid_rows.append({'row_number': row_number, 'error': parsed['error'], 'row_data': row})
+            else:
+                parsed_by_pos[pos] = parsed
+        except Exception as e:
+            logger.exception("Error parsing row %s: %s", row_number, e)
+            invalid_rows.append({'row_number': row_number, 'error': str(e), 'row_data': row})
 
-        if hasattr(file_obj, "read"):
-            content = file_obj.read()
-            # reset pointer if file-like was read elsewhere (some frameworks)
+    students_data = [parsed_by_pos[pos] for pos in sorted(parsed_by_pos)]
+    return students_data, invalid_rows
+
+
+# -------------------- file parsing --------------------
+
+def _iter_csv_row_batches(file_obj, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """csv-module reader used without pandas: lists of up to batch_size row dicts."""
+    import csv
+    from io import StringIO
+
+    if hasattr(file_obj, "read"):
+        content = file_obj.read()
+        if isinstance(content, bytes):
             try:
-                file_obj.seek(0)
+                content = content.decode("utf-8")
             except Exception:
-                pass
-
-            if isinstance(content, bytes):
-                file_name = getattr(file_obj, "name", "").lower()
-                if file_name.endswith(".csv"):
-                    df = pd.read_csv(BytesIO(content))
-                else:
-                    try:
-                        df = pd.read_excel(BytesIO(content))
-                    except Exception:
-                        df = pd.read_csv(BytesIO(content))
-            else:
-                # text - treat as CSV
-                df = pd.read_csv(StringIO(str(content)))
-        else:
-            # file_obj may be a path string
-            fstr = str(file_obj)
-            if fstr.lower().endswith(".csv"):
-                df = pd.read_csv(fstr)
-            else:
-                df = pd.read_excel(fstr)
-
-        rows_iterable = df.to_dict(orient="records")
+                content = content.decode("latin-1", errors="ignore")
     else:
-        import csv
-        from io import StringIO, TextIOWrapper
+        with open(str(file_obj), "r", encoding="utf-8", errors="ignore") as f:
+            content = f.read()
 
-        if hasattr(file_obj, "read"):
-            content = file_obj.read()
-            if isinstance(content, bytes):
-                try:
-                    content = content.decode("utf-8")
-                except Exception:
-                    content = content.decode("latin-1", errors="ignore")
-        else:
-            with open(str(file_obj), "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+    reader = csv.DictReader(StringIO(content))
+    while True:
+        rows = list(islice(reader, batch_size))
+        if not rows:
+            return
+        yield rows
 
-        reader = csv.DictReader(StringIO(content))
-        rows_iterable = list(reader)
 
-    # parse rows
+def _iter_xlsx_row_batches(file_obj, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    openpyxl read-only reader for .xlsx: lists of up to batch_size row dicts
+    from the active sheet, streamed instead of loading the whole workbook.
+    Blank rows are kept (so row numbers match the sheet) except at the end,
+    which pandas' reader trims as well.
+    """
+    wb = load_workbook(file_obj, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(c).strip() if c is not None else "" for c in header]
+
+        def records():
+            blank = 0
+            for values in rows:
+                if all(v is None for v in values):
+                    blank += 1
+                    continue
+                for _ in range(blank):
+                    yield dict.fromkeys(columns)
+                blank = 0
+                yield dict(zip(columns, values))
+
+        records_iter = records()
+        while True:
+            batch = list(islice(records_iter, batch_size))
+            if not batch:
+                return
+            yield batch
+    finally:
+        wb.close()
+
+
+def _parse_row_batch(rows: List[Dict[str, Any]], batch_map: Dict[str, int], row_offset: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """parse_student_row over one batch of row dicts; row_offset as in parse_student_dataframe."""
     students_data: List[Dict[str, Any]] = []
     invalid_rows: List[Dict[str, Any]] = []
-
-    for idx, row in enumerate(rows_iterable):
+    for pos, row in enumerate(rows):
+        row_number = row_offset + pos + 2
         try:
-            parsed = parse_student_row(row)
+            parsed = parse_student_row(row, batch_map)
             if "error" in parsed:
-                invalid_rows.append({'row_number': idx + 2, 'error': parsed['error'], 'row_data': row})
+                invalid_rows.append({'row_number': row_number, 'error': parsed['error'], 'row_data': row})
             else:
                 students_data.append(parsed)
         except Exception as e:
-            logger.exception("Error parsing row %s: %s", idx + 2, e)
-            invalid_rows.append({'row_number': idx + 2, 'error': str(e), 'row_data': row})
+            logger.exception("Error parsing row %s: %s", row_number, e)
+            invalid_rows.append({'row_number': row_number, 'error': str(e), 'row_data': row})
+    return students_data, invalid_rows
+
+
+def _xlsx_frames(source, batch_size: int):
+    """DataFrames of up to batch_size rows from _iter_xlsx_row_batches; cells keep their openpyxl types."""
+    for rows in _iter_xlsx_row_batches(source, batch_size):
+        yield pd.DataFrame(rows, dtype=object)
+
+
+def iter_student_file_batches(file_obj, batch_map: Optional[Dict[str, int]] = None, batch_size: int = CSV_CHUNK_ROWS) -> Iterator[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """
+    Read uploaded file_obj (Django InMemoryUploadedFile, file-like or path)
+    and yield (students_data, invalid_rows) for every batch_size input rows,
+    so callers can write one batch while the next is still being read.
+    Row numbers in invalid_rows are file-wide. BatchMapping is loaded once
+    per file unless batch_map is supplied.
+    """
+    if batch_map is None:
+        batch_map = load_batch_map()
+
+    # Without pandas only CSV can be read, batch_size rows at a time
+    if pd is None:
+        row_offset = 0
+        for rows in _iter_csv_row_batches(file_obj, batch_size):
+            yield _parse_row_batch(rows, batch_map, row_offset)
+            row_offset += len(rows)
+        return
+
+    from io import BytesIO, StringIO
+
+    # CSV is read batch_size rows at a time straight from the file handle
+    # and .xlsx is streamed through openpyxl's read-only mode; only legacy
+    # .xls is read as a single frame and sliced into batches below
+    if hasattr(file_obj, "read"):
+        source = file_obj
+        head = file_obj.read(4)
+        try:
+            file_obj.seek(0)
+        except Exception:
+            # not seekable: buffer the rest behind the sniffed bytes
+            rest = file_obj.read()
+            source = BytesIO(head + rest) if isinstance(head, bytes) else StringIO(head + rest)
+
+        if isinstance(head, bytes):
+            # Pick the reader from the file signature so CSV uploads are
+            # not run through the Excel engine first
+            if head == _XLSX_MAGIC and load_workbook is not None:
+                frames = _xlsx_frames(source, batch_size)
+            elif is_excel_content(head):
+                frames = [pd.read_excel(source)]
+            else:
+                frames = pd.read_csv(source, engine="c", chunksize=batch_size)
+        else:
+            # text - treat as CSV
+            frames = pd.read_csv(source, chunksize=batch_size)
+    else:
+        # file_obj may be a path string
+        fstr = str(file_obj)
+        if fstr.lower().endswith(".csv"):
+            frames = pd.read_csv(fstr, chunksize=batch_size)
+        elif fstr.lower().endswith(".xlsx") and load_workbook is not None:
+            frames = _xlsx_frames(fstr, batch_size)
+        else:
+            frames = [pd.read_excel(fstr)]
+
+    row_offset = 0
+    for df in frames:
+        for start in range(0, len(df), batch_size):
+            yield parse_student_dataframe(df.iloc[start:start + batch_size], batch_map, row_offset + start)
+        row_offset += len(df)
+
+    # leave the upload rewound for any later reader
+    if hasattr(file_obj, "seek"):
+        try:
+            file_obj.seek(0)
+        except Exception:
+            pass
+
+
+def parse_excel_or_csv_file(file_obj, batch_map: Optional[Dict[str, int]] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Read uploaded file_obj (Django InMemoryUploadedFile or file-like),
+    return (students_data, invalid_rows).
+    BatchMapping is loaded once per file unless batch_map is supplied.
+    """
+    students_data: List[Dict[str, Any]] = []
+    invalid_rows: List[Dict[str, Any]] = []
+    for valid, invalid in iter_student_file_batches(file_obj, batch_map):
+        students_data.extend(valid)
+        invalid_rows.extend(invalid)
 
     logger.info("Parsed student file: %d valid rows, %d invalid rows", len(students_data), len(invalid_rows))
     return students_data, invalid_rows
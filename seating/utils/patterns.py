@@ -38,13 +38,24 @@ def get_bench_pattern_for_room(room, cycles=['A', 'B', 'C']):
     Generate bench pattern for a room.
 
     Args:
-        room: Room object with benches attribute
+        room: Room object with total_benches attribute
         cycles: List of bench types to cycle through
 
     Returns:
         Dict mapping bench_no to bench_type
     """
-    pattern = {}
-    for bench_no in range(1, room.benches + 1):
-        pattern[bench_no] = get_bench_type_for_bench(bench_no, cycles)
-    return pattern
+    return dict(enumerate(get_bench_types_for_room(room, cycles), start=1))
+
+def get_bench_types_for_room(room, cycles=['A', 'B', 'C']):
+    """
+    Bench types for a room as a list, for callers that only need sequence access.
+
+    Args:
+        room: Room object with total_benches attribute
+        cycles: List of bench types to cycle through
+
+    Returns:
+        List where index i holds the bench type of bench i + 1
+    """
+    n = len(cycles)
+    return [cycles[i % n] for i in range(room.total_benches)]
@@ -1,5 +1,5 @@
 import logging
-import os
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
 
@@ -10,13 +10,55 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import cm, mm
+from reportlab.pdfbase import pdfmetrics
 
 logger = logging.getLogger(__name__)
 
+# Header text shared by every room page
+_PdfHeader = namedtuple('_PdfHeader', 'institution_name semester_type academic_year department')
+
+# Per-room seat data is passed in as parallel lists (see seat_columns); roll
+# and year are None for a seat without a student
+SEAT_FIELDS = ('row', 'column', 'position', 'bench_no', 'roll', 'year')
+
+
+def seat_columns(rows):
+    """
+    Group (room_id, row, column, position, bench_no, roll, year) tuples into
+    {room_id: {field: [values...]}} with one list per SEAT_FIELDS entry.
+    """
+    seating_by_room = {}
+    for room_id, *values in rows:
+        room_seats = seating_by_room.get(room_id)
+        if room_seats is None:
+            room_seats = seating_by_room[room_id] = {field: [] for field in SEAT_FIELDS}
+        for field, value in zip(SEAT_FIELDS, values):
+            room_seats[field].append(value)
+    return seating_by_room
+
+
+_NO_SEATS = {field: () for field in SEAT_FIELDS}
+
+_YEAR_NAMES = {1: 'YEAR I', 2: 'YEAR II', 3: 'YEAR III'}
+
+# Helvetica glyph widths (1/1000 em, indexed by character code) for _measure
+_HELVETICA_WIDTHS = pdfmetrics.getFont('Helvetica').widths
+
+
+def _measure(text, size):
+    """
+    Width of text in Helvetica at size. Standard fonts have no kerning, so
+    this is a plain sum of glyph widths; non-ASCII text goes to stringWidth.
+    """
+    if text.isascii():
+        return size * sum(_HELVETICA_WIDTHS[ord(ch)] for ch in text) / 1000.0
+    return pdfmetrics.stringWidth(text, 'Helvetica', size)
+
 
 def generate_pdf(allocation, seating_by_room, rooms_list):
     """
     Generate professional, formal PDF for exam seating allocation.
+    seating_by_room maps room id to seat columns as built by seat_columns.
 
     Format:
     - Professional header with institution details
@@ -39,333 +81,388 @@ def generate_pdf(allocation, seating_by_room, rooms_list):
     full_path = Path(settings.MEDIA_ROOT) / rel_path
     full_path.parent.mkdir(parents=True, exist_ok=True)
 
+    width, _ = A4
+    content_width = width - 25 - 25  # same margins as _render_room
+
+    # Exam details are the same on every room page: build the lines (and do
+    # the exam/subject queries) once, before the room loop
+    exam_details = _build_exam_details(allocation, content_width)
+
+    header = _PdfHeader(
+        institution_name=allocation.institution_name,
+        semester_type=allocation.semester_type,
+        academic_year=allocation.academic_year,
+        department=department,
+    )
+    last_idx = len(rooms_list) - 1
+
     c = canvas.Canvas(str(full_path), pagesize=A4)
-    width, height = A4
+    for room_idx, room in enumerate(rooms_list):
+        _render_room(
+            c,
+            header,
+            exam_details,
+            room,
+            seating_by_room.get(room.id, _NO_SEATS),
+            room_idx == last_idx,
+        )
+
+    c.save()
+    return rel_path
+
+
+def _build_exam_details(allocation, content_width):
+    """
+    Lines for the EXAM DETAILS box: exam name and date, then one subject per
+    line, wrapped to fit the box at Helvetica 8.
+    """
+    exam_details = []
+    exam_details.append(f"Exam Name: {allocation.exam.name}")
+    exam_details.append(f"Date: {allocation.exam.date.strftime('%d-%m-%Y')}")
+
+    # Build subject lines: one subject per line, wrapped to fit box width.
+    subject_labels = [
+        f"{s.name}" + (f" ({s.subject_code})" if s.subject_code else "")
+        for s in allocation.subjects.all()
+    ]
+    if subject_labels:
+        exam_details.append("Subjects:")
+
+        max_text_width = content_width - 18  # inner box padding
+        indent = "  - "
+        wrap_indent = "    "
+
+        for subject_label in subject_labels:
+            words = subject_label.split(" ")
+
+            # line widths are kept as running sums instead of re-measuring
+            current_line = indent
+            current_width = _measure(indent, 8)
+            for word in words:
+                word_width = _measure(f"{word} ", 8)
+                if current_width + word_width <= max_text_width:
+                    current_line = f"{current_line}{word} "
+                    current_width += word_width
+                else:
+                    exam_details.append(current_line.rstrip())
+                    current_line = f"{wrap_indent}{word} "
+                    current_width = _measure(current_line, 8)
+            exam_details.append(current_line.rstrip())
+    else:
+        exam_details.append("Subjects: -")
+
+    return exam_details
+
+
+def _collect_room_seats(seats):
+    """
+    One pass over a room's seat columns. Returns (benches, year_rolls):
+    bench dicts sorted by (row, column) with left/right roll labels, and
+    {year: sorted rolls}.
+    """
+    bench_dict = {}
+    year_rolls = {1: [], 2: [], 3: []}
+    for row, column, position, bench_no, roll, year in zip(*(seats[field] for field in SEAT_FIELDS)):
+        bench_key = (row, column)
+        bench = bench_dict.get(bench_key)
+        if bench is None:
+            bench = bench_dict[bench_key] = {
+                'bench_no': bench_no,
+                'row': row,
+                'column': column,
+                'left': None,
+                'right': None,
+            }
+        seat_label = roll if roll is not None else 'Empty'
+        if position == 'left':
+            bench['left'] = seat_label
+        else:
+            bench['right'] = seat_label
+
+        if roll is not None:
+            year_rolls[year].append(roll)
+
+    for rolls in year_rolls.values():
+        rolls.sort()
+
+    benches = sorted(bench_dict.values(), key=lambda b: (b['row'], b['column']))
+    return benches, year_rolls
 
+
+def _render_room(c, header, exam_details, room, seats, is_last_room):
+    """
+    Draw the pages for one room onto canvas c. header supplies the
+    institution/semester/department text, seats the room's seat columns.
+    """
+    width, height = A4
     left_margin = 25
     right_margin = 25
     top_margin = 35
     content_width = width - left_margin - right_margin
 
-    is_last_room = False
+    # Reset y position for new page
+    y = height - top_margin
+
+    # ===== FORMAL HEADER =====
+    # Institution Name - centered, bold, larger
+    c.setFont('Helvetica-Bold', 14)
+    c.drawCentredString(width / 2, y, header.institution_name)
+    y -= 18
+
+    # Academic Year - centered
+    c.setFont('Helvetica', 9)
+    semester_display = header.semester_type.capitalize() if header.semester_type else ""
+    c.drawCentredString(width / 2, y, f"{semester_display} Semester - Academic Year: {header.academic_year}")
+    y -= 14
+
+    # Subject/Department - centered, bold
+    c.setFont('Helvetica-Bold', 10)
+    c.drawCentredString(width / 2, y, header.department)
+    y -= 16
+
+    # Horizontal line for separation
+    c.setLineWidth(2)
+    c.line(left_margin, y, width - right_margin, y)
+    y -= 12
+
+    # ===== EXAM DETAILS SECTION (IMPROVED) =====
+    c.setFont('Helvetica-Bold', 9)
+    c.drawString(left_margin, y, "EXAM DETAILS")
+    y -= 10
+
+    # Calculate box height based on all rendered lines
+    line_height = 10
+    box_height = 15 + (len(exam_details) * line_height)
     
-    for room_idx, room in enumerate(rooms_list):
-        is_last_room = (room_idx == len(rooms_list) - 1)
-        
-        # Reset y position for new page
-        y = height - top_margin
+    c.setLineWidth(1)
+    c.rect(left_margin, y - box_height, content_width, box_height, fill=0)
+    
+    # Details inside box
+    c.setFont('Helvetica', 8)
+    detail_y = y - 10
+    
+    for detail in exam_details:
+        c.drawString(left_margin + 5, detail_y, detail)
+        detail_y -= line_height
+    
+    y -= box_height + 12
 
-        # ===== FORMAL HEADER =====
-        # Institution Name - centered, bold, larger
-        c.setFont('Helvetica-Bold', 14)
-        c.drawCentredString(width / 2, y, allocation.institution_name)
-        y -= 18
-
-        # Academic Year - centered
-        c.setFont('Helvetica', 9)
-        semester_display = allocation.semester_type.capitalize() if allocation.semester_type else ""
-        c.drawCentredString(width / 2, y, f"{semester_display} Semester - Academic Year: {allocation.academic_year}")
-        y -= 14
-
-        # Subject/Department - centered, bold
-        c.setFont('Helvetica-Bold', 10)
-        c.drawCentredString(width / 2, y, department)
-        y -= 16
-
-        # Horizontal line for separation
-        c.setLineWidth(2)
-        c.line(left_margin, y, width - right_margin, y)
-        y -= 12
-
-        # ===== EXAM DETAILS SECTION (IMPROVED) =====
-        c.setFont('Helvetica-Bold', 9)
-        c.drawString(left_margin, y, "EXAM DETAILS")
-        y -= 10
-
-        # Draw exam details box with better formatting
-        exam_details = []
-        exam_details.append(f"Exam Name: {allocation.exam.name}")
-        exam_details.append(f"Date: {allocation.exam.date.strftime('%d-%m-%Y')}")
-
-        # Build subject lines: one subject per line, wrapped to fit box width.
-        subjects = list(allocation.subjects.all())
-        if subjects:
-            exam_details.append("Subjects:")
-
-            max_text_width = content_width - 18  # inner box padding
-            indent = "  - "
-            wrap_indent = "    "
-
-            for s in subjects:
-                subject_label = f"{s.name}" + (f" ({s.subject_code})" if s.subject_code else "")
-                words = subject_label.split(" ")
-
-                current_line = indent
-                for word in words:
-                    candidate = f"{current_line}{word} "
-                    if c.stringWidth(candidate, 'Helvetica', 8) <= max_text_width:
-                        current_line = candidate
-                    else:
-                        exam_details.append(current_line.rstrip())
-                        current_line = f"{wrap_indent}{word} "
-                exam_details.append(current_line.rstrip())
-        else:
-            exam_details.append("Subjects: -")
+    # ===== ROOM & SEATING SECTION =====
+    benches, year_rolls = _collect_room_seats(seats)
 
-        # Calculate box height based on all rendered lines
-        line_height = 10
-        box_height = 15 + (len(exam_details) * line_height)
-        
-        c.setLineWidth(1)
-        c.rect(left_margin, y - box_height, content_width, box_height, fill=0)
-        
-        # Details inside box
+    # Room Header - Bold
+    c.setFont('Helvetica-Bold', 9)
+    room_title = room.name
+    c.drawCentredString(width / 2, y, room_title)
+    y -= 12
+
+    # ===== BENCHES IN PROFESSIONAL GRID FORMAT =====
+    if not benches:
         c.setFont('Helvetica', 8)
-        detail_y = y - 10
-        
-        for detail in exam_details:
-            c.drawString(left_margin + 5, detail_y, detail)
-            detail_y -= line_height
-        
-        y -= box_height + 12
-
-        # ===== ROOM & SEATING SECTION =====
-        assignments = seating_by_room.get(room.id, [])
-
-        # Derive year and section from students
-        year = None
-        section = None
-        for assignment in assignments:
-            if assignment.student and year is None:
-                year = assignment.student.year
-                section = assignment.student.roll[3].upper() if len(assignment.student.roll) >= 4 else 'A'
-                section = section if section in ['A', 'B'] else 'A'
-                break
-
-        # Room Header - Bold
-        c.setFont('Helvetica-Bold', 9)
-        room_title = room.name
-        c.drawCentredString(width / 2, y, room_title)
-        y -= 12
-
-        # ===== BENCHES IN PROFESSIONAL GRID FORMAT =====
-        if not assignments:
-            c.setFont('Helvetica', 8)
-            c.drawString(left_margin, y, "No seat assignments found for this room.")
-            y -= 20
+        c.drawString(left_margin, y, "No seat assignments found for this room.")
+        y -= 20
+        _add_page_footer(c, width, left_margin)
+        c.showPage()
+        return
+    # Draw benches in grid format (use room cols, fallback to 5)
+    bench_width = 75
+    bench_height = 40
+    spacing = 5
+    cols = room.cols if getattr(room, "cols", None) else 5
+    # Calculate centered x_start
+    grid_width = cols * bench_width + (cols - 1) * spacing
+    x_start = left_margin + (content_width - grid_width) / 2
+    y_start = y - 40
+
+    # Bench positions are collected per page and drawn in bulk by
+    # _draw_benches before each page break and after the loop
+    page_benches = []
+    for bench in benches:
+        # Keep exact placement same as preview: use stored seat row/column.
+        row = max(int(bench.get('row', 1)) - 1, 0)
+        col = max(int(bench.get('column', 1)) - 1, 0)
+        x = x_start + col * (bench_width + spacing)
+        yy = y_start - row * (bench_height + spacing)
+
+        # Check if we need a new page
+        if yy < 120:
+            _draw_benches(c, page_benches, bench_width, bench_height)
+            page_benches = []
             _add_page_footer(c, width, left_margin)
             c.showPage()
-            continue
-        # Collect benches
-        bench_dict = {}
-        for a in assignments:
-            bench_key = f"{a.row}-{a.column}"
-            if bench_key not in bench_dict:
-                bench_dict[bench_key] = {
-                    'bench_no': a.bench_no,
-                    'row': a.row,
-                    'column': a.column,
-                    'left': None,
-                    'right': None,
-                }
-            if a.position == 'left':
-                bench_dict[bench_key]['left'] = a.student.roll if a.student else 'Empty'
-            else:
-                bench_dict[bench_key]['right'] = a.student.roll if a.student else 'Empty'
-
-        benches = sorted(bench_dict.values(), key=lambda b: (b['row'], b['column']))
-
-        # Draw benches in grid format (use room cols, fallback to 5)
-        bench_width = 75
-        bench_height = 40
-        spacing = 5
-        cols = room.cols if getattr(room, "cols", None) else 5
-        # Calculate centered x_start
-        grid_width = cols * bench_width + (cols - 1) * spacing
-        x_start = left_margin + (content_width - grid_width) / 2
-        y_start = y - 40
-
-        row_count = 0
-        for bench in benches:
-            # Keep exact placement same as preview: use stored seat row/column.
-            row = max(int(bench.get('row', 1)) - 1, 0)
-            col = max(int(bench.get('column', 1)) - 1, 0)
-            x = x_start + col * (bench_width + spacing)
+            y = height - top_margin
+            _draw_page_header(c, width, header, header.department, left_margin, y)
+            y -= 80
+            y_start = y
             yy = y_start - row * (bench_height + spacing)
 
-            # Check if we need a new page
-            if yy < 120:
+        page_benches.append((x, yy, bench))
+    _draw_benches(c, page_benches, bench_width, bench_height)
+
+    # Move y below seating
+    rows = (len(benches) + cols - 1) // cols
+    y = y_start - rows * (bench_height + spacing) - 15
+
+    # ===== LEGEND =====
+    if y < 130:
+        _add_page_footer(c, width, left_margin)
+        c.showPage()
+        y = height - top_margin
+        _draw_page_header(c, width, header, header.department, left_margin, y)
+        y -= 80
+    
+    c.setFont('Helvetica', 7)
+    c.drawString(left_margin, y, "Legend: L = Left Seat | R = Right Seat")
+    y -= 15
+
+    # ===== YEAR-WISE STUDENT SUMMARY (BOXED) =====
+    c.setFont('Helvetica-Bold', 8)
+    c.drawString(left_margin, y, "STUDENT SUMMARY")
+    y -= 12
+
+    for yr in [1, 2, 3]:
+        if year_rolls[yr]:
+            rolls = year_rolls[yr]
+            count = len(rolls)
+
+            # Check page overflow (reserve space for signature if last room)
+            reserve_space = 80 if is_last_room else 20
+            if y < reserve_space + 70:
                 _add_page_footer(c, width, left_margin)
                 c.showPage()
                 y = height - top_margin
-                _draw_page_header(c, width, allocation, department, left_margin, y)
+                _draw_page_header(c, width, header, header.department, left_margin, y)
                 y -= 80
-                y_start = y
-                yy = y_start - row * (bench_height + spacing)
 
-            # Draw bench box with border
+            # Calculate text height for word wrapping
+            c.setFont('Helvetica', 7)
+            # Rolls share one format, so lines hold a fixed number of them:
+            # size that count from the widest roll so no line overflows,
+            # then slice the list
+            roll_width = max(_measure(roll, 7) for roll in rolls) + _measure(", ", 7)
+            rolls_per_line = max(1, int((content_width - 40) / roll_width))
+            lines = [
+                ", ".join(rolls[i:i + rolls_per_line])
+                for i in range(0, count, rolls_per_line)
+            ]
+
+            # Year box height calculation
+            header_height = 18
+            lines_height = len(lines) * 8
+            box_height = header_height + lines_height + 10
+
+            # Draw box
             c.setLineWidth(0.8)
-            c.setFillColor(colors.HexColor('#F5F5F5'))  # Light gray background
-            c.rect(x, yy, bench_width, bench_height, fill=1)  # Filled
+            c.setFillColor(colors.HexColor('#FFFFFF'))
+            c.rect(left_margin, y - box_height, content_width, box_height, fill=1)
             
             # Border
             c.setLineWidth(0.8)
             c.setStrokeColor(colors.black)
-            c.rect(x, yy, bench_width, bench_height, fill=0)
+            c.rect(left_margin, y - box_height, content_width, box_height, fill=0)
 
-            # Bench number header - bold
-            c.setFont('Helvetica-Bold', 7)
+            # Year header inside box
+            c.setFont('Helvetica-Bold', 8)
             c.setFillColor(colors.black)
-            c.drawString(x + 3, yy + bench_height - 7, f"Bench {bench['bench_no']}")
-
-            # Divider line
+            c.drawString(left_margin + 5, y - 10, f"{_YEAR_NAMES[yr]} - Total Students: {count}")
+            
+            # Line separator
             c.setLineWidth(0.5)
-            c.line(x + 2, yy + bench_height - 11, x + bench_width - 2, yy + bench_height - 11)
+            c.line(left_margin + 5, y - 14, content_width - 5, y - 14)
 
-            # Student IDs
-            c.setFont('Helvetica', 6.5)
-            c.drawString(x + 3, yy + 20, f"L: {bench['left']}")
-            c.drawString(x + 3, yy + 9, f"R: {bench['right']}")
+            # Students list inside box
+            c.setFont('Helvetica', 7)
+            line_y = y - 22
+            for line_text in lines:
+                c.drawString(left_margin + 5, line_y, line_text)
+                line_y -= 8
 
-        # Move y below seating
-        rows = (len(benches) + cols - 1) // cols
-        y = y_start - rows * (bench_height + spacing) - 15
+            y -= box_height + 8
 
-        # ===== LEGEND =====
-        if y < 130:
+    # ===== SIGNATURE SECTION (ONLY ON LAST ROOM) =====
+    if is_last_room:
+        if y < 100:
             _add_page_footer(c, width, left_margin)
             c.showPage()
             y = height - top_margin
-            _draw_page_header(c, width, allocation, department, left_margin, y)
+            _draw_page_header(c, width, header, header.department, left_margin, y)
             y -= 80
-        
-        c.setFont('Helvetica', 7)
-        c.drawString(left_margin, y, "Legend: L = Left Seat | R = Right Seat")
-        y -= 15
 
-        # ===== YEAR-WISE STUDENT SUMMARY (BOXED) =====
-        c.setFont('Helvetica-Bold', 8)
-        c.drawString(left_margin, y, "STUDENT SUMMARY")
-        y -= 12
-
-        year_rolls = {1: [], 2: [], 3: []}
-        for a in assignments:
-            if a.student:
-                year_rolls[a.student.year].append(a.student.roll)
-
-        for yr in year_rolls:
-            year_rolls[yr].sort()
-
-        year_names = {1: 'YEAR I', 2: 'YEAR II', 3: 'YEAR III'}
-
-        for yr in [1, 2, 3]:
-            if year_rolls[yr]:
-                rolls = year_rolls[yr]
-                count = len(rolls)
-
-                # Check page overflow (reserve space for signature if last room)
-                reserve_space = 80 if is_last_room else 20
-                if y < reserve_space + 70:
-                    _add_page_footer(c, width, left_margin)
-                    c.showPage()
-                    y = height - top_margin
-                    _draw_page_header(c, width, allocation, department, left_margin, y)
-                    y -= 80
-
-                # Calculate text height for word wrapping
-                c.setFont('Helvetica', 7)
-                roll_text = ", ".join(rolls)
-                words = roll_text.split(", ")
-                lines = []
-                line = ""
-                for word in words:
-                    test_line = line + word + ", " if line else word + ", "
-                    test_width = c.stringWidth(test_line, 'Helvetica', 7)
-                    if test_width > content_width - 40:
-                        if line:
-                            lines.append(line.rstrip(", "))
-                        line = word + ", "
-                    else:
-                        line = test_line
-                if line:
-                    lines.append(line.rstrip(", "))
-
-                # Year box height calculation
-                header_height = 18
-                lines_height = len(lines) * 8
-                box_height = header_height + lines_height + 10
-
-                # Draw box
-                c.setLineWidth(0.8)
-                c.setFillColor(colors.HexColor('#FFFFFF'))
-                c.rect(left_margin, y - box_height, content_width, box_height, fill=1)
-                
-                # Border
-                c.setLineWidth(0.8)
-                c.setStrokeColor(colors.black)
-                c.rect(left_margin, y - box_height, content_width, box_height, fill=0)
-
-                # Year header inside box
-                c.setFont('Helvetica-Bold', 8)
-                c.setFillColor(colors.black)
-                c.drawString(left_margin + 5, y - 10, f"{year_names[yr]} - Total Students: {count}")
-                
-                # Line separator
-                c.setLineWidth(0.5)
-                c.line(left_margin + 5, y - 14, content_width - 5, y - 14)
-
-                # Students list inside box
-                c.setFont('Helvetica', 7)
-                line_y = y - 22
-                for line_text in lines:
-                    c.drawString(left_margin + 5, line_y, line_text)
-                    line_y -= 8
-
-                y -= box_height + 8
-
-        # ===== SIGNATURE SECTION (ONLY ON LAST ROOM) =====
-        if is_last_room:
-            if y < 100:
-                _add_page_footer(c, width, left_margin)
-                c.showPage()
-                y = height - top_margin
-                _draw_page_header(c, width, allocation, department, left_margin, y)
-                y -= 80
+        y -= 30
 
-            y -= 30
+        # Signature section
+        c.setFont('Helvetica-Bold', 9)
+        c.drawString(left_margin, y, "AUTHORIZED SIGNATURES")
+        y -= 15
 
-            # Signature section
-            c.setFont('Helvetica-Bold', 9)
-            c.drawString(left_margin, y, "AUTHORIZED SIGNATURES")
-            y -= 15
+        # Exam Incharge Signature (LEFT)
+        sig_line_x1 = left_margin
+        sig_line_width = (content_width - 20) / 2
+        
+        c.setLineWidth(0.5)
+        c.line(sig_line_x1, y - 30, sig_line_x1 + sig_line_width - 10, y - 30)
+        c.setFont('Helvetica-Bold', 8)
+        sig_center_x1 = sig_line_x1 + (sig_line_width - 10) / 2
+        c.drawCentredString(sig_center_x1, y - 45, "Exam Incharge")
+        c.setFont('Helvetica', 7)
+        c.drawCentredString(sig_center_x1, y - 52, "(Signature & Date)")
 
-            # Exam Incharge Signature (LEFT)
-            sig_line_x1 = left_margin
-            sig_line_width = (content_width - 20) / 2
-            
-            c.setLineWidth(0.5)
-            c.line(sig_line_x1, y - 30, sig_line_x1 + sig_line_width - 10, y - 30)
-            c.setFont('Helvetica-Bold', 8)
-            sig_center_x1 = sig_line_x1 + (sig_line_width - 10) / 2
-            c.drawCentredString(sig_center_x1, y - 45, "Exam Incharge")
-            c.setFont('Helvetica', 7)
-            c.drawCentredString(sig_center_x1, y - 52, "(Signature & Date)")
+        # HOD Signature (RIGHT)
+        sig_line_x2 = left_margin + sig_line_width + 20
+        c.setLineWidth(0.5)
+        c.line(sig_line_x2, y - 30, sig_line_x2 + sig_line_width - 10, y - 30)
+        c.setFont('Helvetica-Bold', 8)
+        sig_center_x2 = sig_line_x2 + (sig_line_width - 10) / 2
+        c.drawCentredString(sig_center_x2, y - 45, "HOD")
+        c.setFont('Helvetica', 7)
+        c.drawCentredString(sig_center_x2, y - 52, "(Head of Department)")
 
-            # HOD Signature (RIGHT)
-            sig_line_x2 = left_margin + sig_line_width + 20
-            c.setLineWidth(0.5)
-            c.line(sig_line_x2, y - 30, sig_line_x2 + sig_line_width - 10, y - 30)
-            c.setFont('Helvetica-Bold', 8)
-            sig_center_x2 = sig_line_x2 + (sig_line_width - 10) / 2
-            c.drawCentredString(sig_center_x2, y - 45, "HOD")
-            c.setFont('Helvetica', 7)
-            c.drawCentredString(sig_center_x2, y - 52, "(Head of Department)")
+    _add_page_footer(c, width, left_margin)
+    c.showPage()
 
-        _add_page_footer(c, width, left_margin)
-        c.showPage()
 
-    c.save()
-    return rel_path
+def _draw_benches(c, placed, bench_width, bench_height):
+    """
+    Draw bench boxes for one page. placed is a list of (x, y, bench). All
+    boxes go into one path, all divider lines into another and all labels
+    into one text object, so the canvas state is set once per page rather
+    than once per bench.
+    """
+    if not placed:
+        return
+
+    # Bench boxes: light gray fill with black border
+    boxes = c.beginPath()
+    for x, yy, _ in placed:
+        boxes.rect(x, yy, bench_width, bench_height)
+    c.setLineWidth(0.8)
+    c.setStrokeColor(colors.black)
+    c.setFillColor(colors.HexColor('#F5F5F5'))
+    c.drawPath(boxes, stroke=1, fill=1)
+
+    # Divider lines under the bench number
+    dividers = c.beginPath()
+    for x, yy, _ in placed:
+        dividers.moveTo(x + 2, yy + bench_height - 11)
+        dividers.lineTo(x + bench_width - 2, yy + bench_height - 11)
+    c.setLineWidth(0.5)
+    c.drawPath(dividers, stroke=1, fill=0)
+
+    # Labels: bench number header (bold) and student IDs
+    c.setFillColor(colors.black)
+    text = c.beginText()
+    text.setFont('Helvetica-Bold', 7)
+    for x, yy, bench in placed:
+        text.setTextOrigin(x + 3, yy + bench_height - 7)
+        text.textOut(f"Bench {bench['bench_no']}")
+    text.setFont('Helvetica', 6.5)
+    for x, yy, bench in placed:
+        text.setTextOrigin(x + 3, yy + 20)
+        text.textOut(f"L: {bench['left']}")
+        text.setTextOrigin(x + 3, yy + 9)
+        text.textOut(f"R: {bench['right']}")
+    c.drawText(text)
+    c.setFont('Helvetica', 6.5)
 
 
 def _draw_page_header(c, width, allocation, department, left_margin, y):
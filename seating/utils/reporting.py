@@ -3,13 +3,58 @@ import json
 from django.conf import settings
 from django.core.files.base import ContentFile
 
+
+def _dumps_report(report):
+	"""Serialize report as indented UTF-8 JSON bytes; unknown types become str."""
+	return json.dumps(report, indent=2, default=str).encode('utf-8')
+
+
+def _reports_dir():
+	return os.path.join(getattr(settings, 'MEDIA_ROOT', '.'), 'reports')
+
+
+def _convert_legacy_index(reports_dir):
+	"""
+	Fold a pre-jsonl MEDIA_ROOT/reports/index.json ({id: filename}) into
+	index.jsonl, ahead of any lines already there so newer saves still win,
+	then remove it. A no-op once converted.
+	"""
+	legacy_path = os.path.join(reports_dir, 'index.json')
+	if not os.path.exists(legacy_path):
+		return
+	try:
+		with open(legacy_path, 'r', encoding='utf-8') as f:
+			legacy = json.load(f)
+	except (OSError, ValueError):
+		# unreadable legacy index: leave it in place rather than lose it
+		return
+	if not isinstance(legacy, dict):
+		return
+
+	index_path = os.path.join(reports_dir, 'index.jsonl')
+	# JSON object keys are strings; new lines carry the integer id
+	lines = [
+		json.dumps({'id': int(alloc_id) if alloc_id.isdigit() else alloc_id, 'file': filename}) + '\n'
+		for alloc_id, filename in legacy.items()
+	]
+	if os.path.exists(index_path):
+		with open(index_path, 'r', encoding='utf-8') as f:
+			lines.extend(f.readlines())
+	tmp_path = index_path + '.tmp'
+	with open(tmp_path, 'w', encoding='utf-8') as f:
+		f.writelines(lines)
+	os.replace(tmp_path, index_path)
+	os.remove(legacy_path)
+
+
 def save_allocation_report(allocation, seating_by_room, room_students_map, extra_meta=None):
 	"""
 	Write JSON allocation report under MEDIA_ROOT/reports/allocation_{id}.json.
-	Also update MEDIA_ROOT/reports/index.json mapping allocation.id -> filename.
+	Also append allocation.id -> filename to MEDIA_ROOT/reports/index.jsonl,
+	one JSON object per line; a later line for the same id wins.
 	Returns the full filesystem path to the saved report.
 	"""
-	reports_dir = os.path.join(getattr(settings, 'MEDIA_ROOT', '.'), 'reports')
+	reports_dir = _reports_dir()
 	os.makedirs(reports_dir, exist_ok=True)
 	report_path = os.path.join(reports_dir, f'allocation_report_{allocation.id}.json')
 
@@ -43,28 +88,23 @@ def save_allocation_report(allocation, seating_by_room, room_students_map, extra
 			'total_assigned': sum(v for k,v in year_counts.items() if k != 'empty'),
 			'total_empty': year_counts['empty']
 		}
-	# write report
-	with open(report_path, 'w', encoding='utf-8') as f:
-		json.dump(report, f, indent=2, default=str)
+	# serialize once; the same bytes go to disk and to report_file below
+	data = _dumps_report(report)
+	with open(report_path, 'wb') as f:
+		f.write(data)
 
-	# update index
-	index_path = os.path.join(reports_dir, 'index.json')
-	index_data = {}
-	if os.path.exists(index_path):
-		try:
-			with open(index_path, 'r', encoding='utf-8') as f:
-				index_data = json.load(f)
-		except Exception:
-			index_data = {}
-	index_data[str(allocation.id)] = os.path.basename(report_path)
-	with open(index_path, 'w', encoding='utf-8') as f:
-		json.dump(index_data, f, indent=2)
+	# update index: one appended line per save instead of rewriting the
+	# whole mapping; a single short O_APPEND write does not interleave
+	_convert_legacy_index(reports_dir)
+	index_path = os.path.join(reports_dir, 'index.jsonl')
+	entry = json.dumps({'id': allocation.id, 'file': os.path.basename(report_path)})
+	with open(index_path, 'a', encoding='utf-8') as f:
+		f.write(entry + '\n')
 
 	# attempt to save onto allocation.report_file if the model has that field
 	try:
 		if hasattr(allocation, 'report_file'):
-			with open(report_path, 'rb') as f:
-				allocation.report_file.save(os.path.basename(report_path), ContentFile(f.read()), save=True)
+			allocation.report_file.save(os.path.basename(report_path), ContentFile(data), save=True)
 	except Exception:
 		# ignore if saving to model field fails
 		pass
@@ -1,5 +1,5 @@
 ﻿from django.shortcuts import render, get_object_or_404, redirect
-from django.http import HttpResponse, JsonResponse
+from django.http import FileResponse, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.core.files.base import ContentFile
@@ -12,8 +12,10 @@ from django.views.decorators.http import require_GET
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
 
+import json
 import os
 import logging
 
@@ -24,9 +26,11 @@ from .serializers import (
     StudentSerializer, ExamSerializer, RoomSerializer,
     AllocationSerializer, AllocationCreateSerializer,
     ExcelUploadSerializer, SeatAssignmentSerializer, SubjectSerializer,
+    iter_seat_assignment_rows,
 )
 from .utils.allocation import generate_allocation
-from .utils.parsers import parse_excel_or_csv_file
+from .utils.parsers import iter_student_file_batches, parse_excel_or_csv_file
+from .utils.db import retry_on_locked
 
 
 
@@ -35,6 +39,13 @@ from .utils.parsers import parse_excel_or_csv_file
 #                       FILE UPLOAD / IMPORT
 # =====================================================================
 
+UPLOAD_BATCH_SIZE = 1000
+UPLOAD_UPDATE_FIELDS = [
+    'name', 'batch_code', 'dept_code', 'serial', 'year', 'section',
+    'department', 'upload_batch_id', 'extra',
+]
+
+
 class ExcelUploadView(APIView):
     """
     API endpoint for uploading Excel/CSV files containing student data.
@@ -62,74 +73,83 @@ class ExcelUploadView(APIView):
             return Response({'error': 'Invalid year or section'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            students_data, invalid_rows = parse_excel_or_csv_file(excel_file)
-
-            created_count = 0
-            updated_count = 0
-            student_objs = []
-
-            from django.db import transaction as dj_transaction, DatabaseError
+            from django.db import transaction as dj_transaction
             import uuid
 
-            # Clear all old student data before processing new upload
-            Student.objects.all().delete()
-            logger.info('Cleared all old student data before new upload (API)')
-
             upload_batch_id = str(uuid.uuid4())[:8]  # Short unique ID
 
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    with dj_transaction.atomic():
-                        # Do NOT clear all students; append to existing
-                        for row in students_data:
-                            student, created = Student.objects.update_or_create(
-                                roll=row['roll'],
-                                defaults={
-                                    'name': row['name'],
-                                    'batch_code': row['batch_code'],
-                                    'dept_code': row['dept_code'],
-                                    'serial': row['serial'],
-                                    'year': year,  # Use selected year
-                                    'section': section,  # Use selected section
-                                    'department': row.get('department'),
-                                    'upload_batch_id': upload_batch_id,
-                                    'extra': row.get('extra'),
-                                }
-                            )
-                            if created:
-                                created_count += 1
-                            else:
-                                updated_count += 1
-                            student_objs.append(student)
-                    break
-                except DatabaseError as db_error:
-                    if 'database is locked' in str(db_error).lower() and attempt < max_retries - 1:
-                        import time
-                        time.sleep(0.5 * (attempt + 1))
-                        continue
-                    else:
-                        raise db_error
-
-            # Count students by year and section
-            year_sec_counts = {}
-            for student in student_objs:
-                key = f"{student.year}-{student.section}"
-                year_sec_counts[key] = year_sec_counts.get(key, 0) + 1
+            def do_upload():
+                # Each attempt re-reads the file, so a retry starts clean
+                excel_file.seek(0)
+                invalid_rows = []
+                seen_rolls = set()
+                updated = 0
+                with dj_transaction.atomic():
+                    # An upload replaces the selected year/section: an upsert
+                    # alone would keep students dropped from the new file and
+                    # seat them in the next allocation. Only that group is
+                    # cleared (not the whole table), inside the transaction so
+                    # a failed upload leaves the previous rows in place. The
+                    # upsert below still covers rolls held by another group.
+                    deleted, _ = Student.objects.filter(year=year, section=section).delete()
+                    logger.info('Cleared %d students of Year %s Section %s before upload (API)',
+                                deleted, year, section)
+
+                    # The file is parsed UPLOAD_BATCH_SIZE rows at a time and
+                    # each batch is upserted before the next one is read.
+                    # Rows are keyed by roll (last one wins) since an upsert
+                    # batch may not touch the same roll twice.
+                    for valid, invalid in iter_student_file_batches(excel_file, batch_size=UPLOAD_BATCH_SIZE):
+                        invalid_rows.extend(invalid)
+                        rows_by_roll = {row['roll']: row for row in valid}
+                        if not rows_by_roll:
+                            continue
+                        # rolls written by an earlier batch of this upload are
+                        # not counted again
+                        new_rolls = rows_by_roll.keys() - seen_rolls
+                        updated += Student.objects.filter(roll__in=list(new_rolls)).count()
+                        seen_rolls.update(new_rolls)
+                        Student.objects.bulk_create(
+                            [
+                                Student(
+                                    roll=roll,
+                                    name=row['name'],
+                                    batch_code=row['batch_code'],
+                                    dept_code=row['dept_code'],
+                                    serial=row['serial'],
+                                    year=year,  # Use selected year
+                                    section=section,  # Use selected section
+                                    department=row.get('department'),
+                                    upload_batch_id=upload_batch_id,
+                                    extra=row.get('extra'),
+                                )
+                                for roll, row in rows_by_roll.items()
+                            ],
+                            update_conflicts=True,
+                            unique_fields=['roll'],
+                            update_fields=UPLOAD_UPDATE_FIELDS,
+                        )
+                return len(seen_rolls), len(seen_rolls) - updated, updated, invalid_rows
+
+            total, created_count, updated_count, invalid_rows = retry_on_locked(do_upload)
+
+            # Every row gets the selected year and section
+            year_sec_counts = {f"{year}-{section}": total} if total else {}
 
             response_data = {
                 'message': (
-                    f'Successfully processed {len(student_objs)} students for Year {year} Section {section}. '
+                    f'Successfully processed {total} students for Year {year} Section {section}. '
                     f'Created: {created_count}, Updated: {updated_count}'
                 ),
-                'students_count': len(student_objs),
+                'students_count': total,
                 'year_sec_counts': year_sec_counts,
                 'upload_batch_id': upload_batch_id,
                 'invalid_rows_count': len(invalid_rows),
                 'invalid_rows': invalid_rows[:10],
             }
 
-            # CSV preview for invalid rows (if any)
+            # CSV preview for invalid rows (if any), limited to the same
+            # rows as the structured invalid_rows list above
             if invalid_rows:
                 import csv
                 import io as py_io
@@ -139,7 +159,7 @@ class ExcelUploadView(APIView):
                     fieldnames=['row_number', 'error', 'roll', 'name', 'department', 'extra']
                 )
                 writer.writeheader()
-                for invalid in invalid_rows:
+                for invalid in response_data['invalid_rows']:
                     row_data = invalid['row_data']
                     writer.writerow({
                         'row_number': invalid['row_number'],
@@ -177,71 +197,79 @@ class GenerateAllocationView(APIView):
 
         validated = serializer.validated_data
         exam_name = validated.get('exam_name')
-        exam_date = validated.get('exam_date')
+        exam_date = validated['exam_date']  # already a date
         num_rooms = validated.get('num_rooms', 1)
         distribution_strategy = validated.get('distribution_strategy', 'block')
         flip_lr = validated.get('flip_lr', False)
         seed = validated.get('random_seed', request.data.get('seed'))
 
         try:
-            from datetime import datetime
-            exam_date_parsed = datetime.strptime(exam_date, '%Y-%m-%d').date()
             exam, created = Exam.objects.get_or_create(
                 name=exam_name,
-                date=exam_date_parsed,
+                date=exam_date,
                 defaults={'year': 1}  # or any default year you want
             )
 
             # Convert numeric options
             num_rooms = int(num_rooms) if num_rooms is not None else 1
 
-            with transaction.atomic():
-                # Remove previous allocations for this exam (project choice)
-                SeatAssignment.objects.filter(allocation__exam=exam).delete()
-                Allocation.objects.filter(exam=exam).delete()
-                Room.objects.filter(allocations__exam=exam).delete()
-
-                # Create rooms dynamically with default dimensions
-                rooms = []
-                default_rows = 6
-                default_cols = 5
-                default_benches = default_rows * default_cols
-                default_seats = default_benches * 2
-                for i in range(1, num_rooms + 1):
-                    room = Room.objects.create(
-                        name=f"Room {exam.name}-{i}",
-                        rows=default_rows,
-                        cols=default_cols,
-                        benches_per_room=default_benches,
+            def do_allocate():
+                with transaction.atomic():
+                    # Remove previous allocations for this exam (project choice)
+                    # Room ids are read before the allocations go, since the join
+                    # through allocations__exam is empty afterwards. Deleting the
+                    # allocations cascades to their seat assignments; rooms still
+                    # linked to another exam's allocation are kept.
+                    room_ids = list(Room.objects.filter(allocations__exam=exam).values_list('id', flat=True))
+                    Allocation.objects.filter(exam=exam).delete()
+                    Room.objects.filter(id__in=room_ids, allocations__isnull=True).delete()
+
+                    # Create rooms dynamically with default dimensions, in one
+                    # INSERT; pks come back on PostgreSQL and SQLite >= 3.35
+                    default_rows = 6
+                    default_cols = 5
+                    default_benches = default_rows * default_cols
+                    default_seats = default_benches * 2
+                    rooms = Room.objects.bulk_create([
+                        Room(name=f"Room {exam.name}-{i}", rows=default_rows, cols=default_cols)
+                        for i in range(1, num_rooms + 1)
+                    ])
+
+                    allocation = Allocation.objects.create(
+                        exam=exam,
+                        name=f"Allocation for {exam.name}",
+                        num_rooms=num_rooms,
                         seats_per_room=default_seats,
+                        distribution_strategy=distribution_strategy,
+                        random_seed=int(seed) if seed else None,
+                        flip_lr=flip_lr,
+                    )
+                    # the allocation is new, so add() skips set()'s diff query
+                    allocation.rooms.add(*rooms)
+
+                    # IMPORTANT: match allocation.py signature: student_queryset
+                    generate_allocation(
+                        allocation=allocation,
+                        student_queryset=Student.objects.all(),
+                        rooms=rooms,
+                        rows_per_room=None,
+                        cols_per_room=None,
+                        distribution_strategy=distribution_strategy,
+                        seed=int(seed) if seed else None,
+                        flip_lr=flip_lr,
                     )
-                    rooms.append(room)
-
-                allocation = Allocation.objects.create(
-                    exam=exam,
-                    name=f"Allocation for {exam.name}",
-                    num_rooms=num_rooms,
-                    seats_per_room=default_seats,
-                    distribution_strategy=distribution_strategy,
-                    random_seed=int(seed) if seed else None,
-                    flip_lr=flip_lr,
-                )
-                allocation.rooms.set(rooms)
 
-                # IMPORTANT: match allocation.py signature: student_queryset
-                generate_allocation(
-                    allocation=allocation,
-                    student_queryset=Student.objects.all(),
-                    rooms=rooms,
-                    rows_per_room=None,
-                    cols_per_room=None,
-                    distribution_strategy=distribution_strategy,
-                    seed=int(seed) if seed else None,
-                    flip_lr=flip_lr,
-                )
+                    logger.info("Allocation completed successfully.")
+                return allocation
 
-                logger.info("Allocation completed successfully.")
+            allocation = retry_on_locked(do_allocate)
 
+            # Reload with exam, rooms and assignments (plus their student/room)
+            # prefetched so serializing the new allocation is a fixed number of
+            # queries rather than two per seat.
+            allocation = AllocationSerializer.setup_eager_loading(
+                Allocation.objects.all()
+            ).get(pk=allocation.pk)
             serializer_out = AllocationSerializer(allocation)
             return Response({'allocation': serializer_out.data}, status=status.HTTP_201_CREATED)
 
@@ -264,12 +292,15 @@ class AllocationReportView(APIView):
         # Prefer model field
         if hasattr(allocation, 'report_file') and allocation.report_file:
             try:
+                # FileResponse streams the file (sendfile when the server
+                # offers wsgi.file_wrapper) and closes it when done
                 report_file = allocation.report_file
-                response = HttpResponse(report_file.read(), content_type='application/json')
-                response['Content-Disposition'] = (
-                    f'attachment; filename="{os.path.basename(report_file.name)}"'
+                return FileResponse(
+                    report_file.open('rb'),
+                    content_type='application/json',
+                    as_attachment=True,
+                    filename=os.path.basename(report_file.name),
                 )
-                return response
             except Exception as e:
                 return Response(
                     {'error': f'Error retrieving report from model field: {str(e)}'},
@@ -282,12 +313,12 @@ class AllocationReportView(APIView):
             filename = os.path.join(media_root, f"allocation_report_{allocation.id}.json")
             if os.path.exists(filename):
                 try:
-                    with open(filename, 'rb') as f:
-                        resp = HttpResponse(f.read(), content_type='application/json')
-                        resp['Content-Disposition'] = (
-                            f'attachment; filename="{os.path.basename(filename)}"'
-                        )
-                        return resp
+                    return FileResponse(
+                        open(filename, 'rb'),
+                        content_type='application/json',
+                        as_attachment=True,
+                        filename=os.path.basename(filename),
+                    )
                 except Exception as e:
                     return Response(
                         {'error': f'Error retrieving report from MEDIA_ROOT: {str(e)}'},
@@ -302,8 +333,11 @@ class AllocationPreviewView(APIView):
     Simple API endpoint for previewing allocation data as JSON.
     """
     def get(self, request, allocation_id):
-        allocation = get_object_or_404(Allocation, id=allocation_id)
-        serializer = AllocationSerializer(allocation)
+        fields = AllocationSerializer.requested_fields(request)
+        allocation = get_object_or_404(
+            AllocationSerializer.setup_eager_loading(Allocation.objects.all(), fields), id=allocation_id
+        )
+        serializer = AllocationSerializer(allocation, fields=fields)
         return Response(serializer.data)
 
 
@@ -311,20 +345,43 @@ class AllocationRoomsView(APIView):
     """
     API endpoint for getting room-specific allocation data.
     """
+    # seat_assignments (the last AllocationSerializer field) is left out of
+    # the serializer and streamed into the allocation object by get()
+    ALLOCATION_FIELDS = [
+        name for name in AllocationSerializer.Meta.fields if name != 'seat_assignments'
+    ]
+
     def get(self, request, allocation_id, room_id):
-        allocation = get_object_or_404(Allocation, id=allocation_id)
+        fields = self.ALLOCATION_FIELDS
+        allocation = get_object_or_404(
+            AllocationSerializer.setup_eager_loading(Allocation.objects.all(), fields), id=allocation_id
+        )
         room = get_object_or_404(Room, id=room_id)
 
-        seat_assignments = SeatAssignment.objects.filter(
-            allocation=allocation, room=room
-        ).select_related('student')
+        allocation_seats = SeatAssignment.objects.filter(allocation=allocation)
+        seat_rooms = Room.objects.filter(id__in=allocation_seats.values('room_id'))
+        rooms_by_id = {data['id']: data for data in RoomSerializer(seat_rooms, many=True).data}
+        room_data = RoomSerializer(room).data
+        allocation_data = AllocationSerializer(allocation, fields=fields).data
 
-        serializer = SeatAssignmentSerializer(seat_assignments, many=True)
-        return Response({
-            'allocation': AllocationSerializer(allocation).data,
-            'room': RoomSerializer(room).data,
-            'seat_assignments': serializer.data
-        })
+        def encode(obj):
+            # same output as DRF's JSONRenderer
+            return json.dumps(obj, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+
+        def encode_rows(rows):
+            for i, row in enumerate(rows):
+                yield (',' if i else '') + encode(row)
+
+        # The document Response({'allocation', 'room', 'seat_assignments'})
+        # used to render, with both seat lists encoded row by row
+        def stream():
+            yield '{"allocation":' + encode(allocation_data)[:-1] + ',"seat_assignments":['
+            yield from encode_rows(iter_seat_assignment_rows(allocation_seats, rooms_by_id))
+            yield ']},"room":' + encode(room_data) + ',"seat_assignments":['
+            yield from encode_rows(iter_seat_assignment_rows(allocation_seats.filter(room=room), {room.id: room_data}))
+            yield ']}'
+
+        return StreamingHttpResponse(stream(), content_type='application/json')
 
 
 # =====================================================================
@@ -446,42 +503,33 @@ def upload_view(request):
                     continue
 
                 # Process students for this file
-                created_count = 0
-                updated_count = 0
+                def do_upload():
+                    created_count = 0
+                    updated_count = 0
+                    with transaction.atomic():
+                        # Do NOT clear existing students; append to database
+                        for student_data in students_data:
+                            student, created = Student.objects.update_or_create(
+                                roll=student_data['roll'],
+                                defaults={
+                                    'name': student_data['name'],
+                                    'batch_code': student_data['batch_code'],
+                                    'dept_code': student_data['dept_code'],
+                                    'serial': student_data['serial'],
+                                    'year': year,  # Use selected year
+                                    'section': section,  # Use selected section
+                                    'department': student_data.get('department'),
+                                    'upload_batch_id': upload_batch_id,
+                                    'extra': student_data.get('extra'),
+                                }
+                            )
+                            if created:
+                                created_count += 1
+                            else:
+                                updated_count += 1
+                    return created_count, updated_count
 
-                from django.db import DatabaseError
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        with transaction.atomic():
-                            # Do NOT clear existing students; append to database
-                            for student_data in students_data:
-                                student, created = Student.objects.update_or_create(
-                                    roll=student_data['roll'],
-                                    defaults={
-                                        'name': student_data['name'],
-                                        'batch_code': student_data['batch_code'],
-                                        'dept_code': student_data['dept_code'],
-                                        'serial': student_data['serial'],
-                                        'year': year,  # Use selected year
-                                        'section': section,  # Use selected section
-                                        'department': student_data.get('department'),
-                                        'upload_batch_id': upload_batch_id,
-                                        'extra': student_data.get('extra'),
-                                    }
-                                )
-                                if created:
-                                    created_count += 1
-                                else:
-                                    updated_count += 1
-                        break
-                    except DatabaseError as db_error:
-                        if 'database is locked' in str(db_error).lower() and attempt < max_retries - 1:
-                            import time
-                            time.sleep(0.5 * (attempt + 1))
-                            continue
-                        else:
-                            raise db_error
+                created_count, updated_count = retry_on_locked(do_upload)
 
                 total_students_created += created_count
                 total_students_updated += updated_count
@@ -713,9 +761,13 @@ def allocation_form_view(request):
                 name = f"Allocation for {exam.name}"
 
             with transaction.atomic():
-                SeatAssignment.objects.filter(allocation__exam=exam).delete()
+                # Remove previous allocations for this exam. Room ids are read
+                # first, since the join through allocations__exam is empty
+                # afterwards. Deleting the allocations cascades to their seat
+                # assignments; rooms still linked to another exam are kept.
+                room_ids = list(Room.objects.filter(allocations__exam=exam).values_list('id', flat=True))
                 Allocation.objects.filter(exam=exam).delete()
-                Room.objects.filter(allocations__exam=exam).delete()
+                Room.objects.filter(id__in=room_ids, allocations__isnull=True).delete()
 
                 rooms_created = []
                 for room_data in rooms_data:
@@ -724,8 +776,6 @@ def allocation_form_view(request):
                         defaults={
                             'rows': room_data['rows'],
                             'cols': room_data['cols'],
-                            'benches_per_room': room_data['benches_per_room'],
-                            'seats_per_room': room_data['seats_per_room'],
                         }
                     )
                     rooms_created.append(room)
@@ -807,9 +857,15 @@ def allocation_form_view(request):
 def preview_view(request, allocation_id):
     """Preview allocation details with room-wise and year-wise counts."""
     allocation = get_object_or_404(Allocation, id=allocation_id)
+    # Stream assignments in index order instead of caching the whole queryset,
+    # loading only the columns the grid template reads.
     seat_assignments = SeatAssignment.objects.filter(
         allocation=allocation
-    ).select_related('room', 'student').order_by('room', 'row', 'column', 'position')
+    ).select_related('room', 'student').only(
+        'row', 'column', 'position', 'bench_no', 'bench_type',
+        'room__name', 'room__rows', 'room__cols',
+        'student__roll', 'student__year',
+    ).order_by('room', 'row', 'column', 'position').iterator(chunk_size=2000)
 
     rooms_data = {}
     # Calculate counts from actual assignments
@@ -970,24 +1026,25 @@ def allocation_pdf_view(request, allocation_id):
     media_root = getattr(settings, 'MEDIA_ROOT', None)
 
     try:
-        from .utils.pdf_generator import generate_pdf
+        from .utils.pdf_generator import generate_pdf, seat_columns
 
-        seat_assignments = SeatAssignment.objects.filter(
+        # Plain tuples grouped into per-room column lists; the PDF only needs
+        # these fields, so no model instances are built
+        seat_rows = SeatAssignment.objects.filter(
             allocation=allocation
-        ).select_related('room', 'student').order_by('room', 'bench_no', 'seat_pos')
-
-        seating_by_room = {}
-        for assignment in seat_assignments:
-            room_id = assignment.room_id
-            if room_id not in seating_by_room:
-                seating_by_room[room_id] = []
-            seating_by_room[room_id].append(assignment)
+        ).order_by('room', 'bench_no', 'seat_pos').values_list(
+            'room_id', 'row', 'column', 'position', 'bench_no', 'student__roll', 'student__year'
+        )
+        seating_by_room = seat_columns(seat_rows)
 
         # Use allocation.rooms.all() to ensure rooms are included even if assignments are empty
         rooms_list = list(allocation.rooms.all())
 
         # Log for debugging
-        logger.info(f"PDF generation: {len(seat_assignments)} assignments, {len(rooms_list)} rooms")
+        logger.info(
+            "PDF generation: %d assignments, %d rooms",
+            sum(len(seats['row']) for seats in seating_by_room.values()), len(rooms_list)
+        )
 
         pdf_rel_path = generate_pdf(allocation, seating_by_room, rooms_list)
 
@@ -1077,8 +1134,9 @@ def room_list(request):
 
 @api_view(['GET'])
 def allocation_list(request):
-    allocations = Allocation.objects.all().prefetch_related('rooms', 'seat_assignments')
-    serializer = AllocationSerializer(allocations, many=True)
+    fields = AllocationSerializer.requested_fields(request)
+    allocations = AllocationSerializer.setup_eager_loading(Allocation.objects.all(), fields)
+    serializer = AllocationSerializer(allocations, many=True, fields=fields)
     return Response(serializer.data)
 
 